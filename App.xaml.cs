@@ -3,11 +3,13 @@ using Microsoft.Extensions.Logging;
 using Serilog;
 using System.Diagnostics;
 using System.IO;
+using System.Net;
 using System.Net.Http;
 using System.Linq;
 using System.Threading.Tasks;
 using System.Windows;
 using StockfishCompiler.Helpers;
+using StockfishCompiler.Models;
 using StockfishCompiler.Services;
 using StockfishCompiler.ViewModels;
 using StockfishCompiler.Views;
@@ -59,7 +61,20 @@ namespace StockfishCompiler
                 {
                     client.Timeout = TimeSpan.FromMinutes(10);
                     client.DefaultRequestHeaders.UserAgent.ParseAdd("StockfishCompiler/1.0");
-                });
+                    // Prefer HTTP/2, falling back to HTTP/1.1 where the server doesn't offer it
+                    client.DefaultRequestVersion = HttpVersion.Version20;
+                    client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
+                })
+                // Decompress gzip/deflate/brotli responses, which shrinks the releases JSON
+                .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+                {
+                    AutomaticDecompression = DecompressionMethods.All,
+                    PooledConnectionLifetime = TimeSpan.FromMinutes(15),
+                    PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+                    MaxConnectionsPerServer = 8 // Both networks' parallel range segments (StockfishDownloader.DownloadSegments each)
+                })
+                // The pooled handler recycles connections itself, so keep it for the app's lifetime
+                .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 
                 // Register CompilerInstallerService (no longer needs HttpClient)
                 services.AddSingleton<ICompilerInstallerService, CompilerInstallerService>();
@@ -75,6 +90,9 @@ namespace StockfishCompiler
                 services.AddSingleton<IUserSettingsService, UserSettingsService>();
                 services.AddSingleton<NetworkValidationManager>();
 
+                // Command-line overrides (--release, --dev, --source=, --arch=, --yes)
+                services.AddSingleton(StartupOptions.Parse(e.Args));
+
                 // ViewModels
                 services.AddSingleton<MainViewModel>();
                 services.AddSingleton<BuildViewModel>(); // Singleton to preserve state when switching tabs
@@ -105,6 +123,11 @@ namespace StockfishCompiler
                 });
 
                 Log.Information("Application startup complete");
+
+                if (Services.GetRequiredService<StartupOptions>().Unattended)
+                {
+                    _ = RunUnattendedBuildAsync();
+                }
             }
             catch (Exception ex)
             {
@@ -120,6 +143,31 @@ namespace StockfishCompiler
             }
         }
 
+        private async Task RunUnattendedBuildAsync()
+        {
+            var exitCode = 1;
+            try
+            {
+                Log.Information("Running unattended build");
+                var config = await Services.GetRequiredService<MainViewModel>().PrepareUnattendedBuildAsync();
+                if (config == null)
+                {
+                    Log.Error("Unattended build aborted - no compiler or architecture available");
+                }
+                else
+                {
+                    var result = await Services.GetRequiredService<IBuildService>().BuildAsync(config);
+                    exitCode = result.Success ? 0 : result.ExitCode != 0 ? result.ExitCode : 1;
+                }
+            }
+            catch (Exception ex)
+            {
+                Log.Error(ex, "Unattended build failed");
+            }
+
+            Shutdown(exitCode);
+        }
+
         protected override void OnExit(ExitEventArgs e)
         {
             Log.Information("Application exiting with code {ExitCode}", e.ApplicationExitCode);
@@ -284,7 +332,7 @@ namespace StockfishCompiler
 
                             if (!hasActiveSentinel && info.LastWriteTimeUtc < cutoff)
                             {
-                                info.Delete(true);
+                                FileSystemHelper.DeleteDirectory(dir);
                                 Log.Information("Removed stale temp directory {TempDir}", dir);
                             }
                         }
@@ -36,5 +36,6 @@ public static class Architectures
     public const string X86_64_SSSE3 = "x86-64-ssse3";
     public const string X86_64_SSE3_POPCNT = "x86-64-sse3-popcnt";
     public const string ARMV8 = "armv8";
+    public const string ARMV8_DOTPROD = "armv8-dotprod";
     public const string APPLE_SILICON = "apple-silicon";
 }
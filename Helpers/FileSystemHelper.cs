@@ -0,0 +1,152 @@
+using System.IO;
+using System.Runtime.Versioning;
+using System.Security.AccessControl;
+using System.Security.Cryptography;
+
+namespace StockfishCompiler.Helpers;
+
+public static class FileSystemHelper
+{
+    private const int CopyBufferSize = 1024 * 1024; // 1 MiB keeps syscall count low for the ~50-100 MB executable
+    private const int MaxDeleteParallelism = 8;
+
+    // Win32 error codes
+    private const int ErrorInvalidFunction = 1;
+    private const int ErrorSharingViolation = 32;
+    private const int ErrorLockViolation = 33;
+    private const int ErrorNotSupported = 50;
+    private const int ErrorInvalidParameter = 87;
+
+    // errno values (Linux)
+    private const int Exdev = 18;
+    private const int Einval = 22;
+    private const int Enosys = 38;
+    private const int Eopnotsupp = 95;
+
+    /// <summary>
+    /// Moves a file into place, overwriting the destination. On the same volume this is a rename; across
+    /// volumes the OS copies in-kernel (CopyFileEx / copy_file_range). Falls back to a copy when the source
+    /// can't be deleted, e.g. while an antivirus scanner still holds the freshly linked executable open.
+    /// </summary>
+    public static void MoveOrCopyFile(string sourcePath, string destinationPath)
+    {
+        try
+        {
+            File.Move(sourcePath, destinationPath, overwrite: true);
+        }
+        catch (Exception ex) when (IsSourceInUse(ex) && File.Exists(sourcePath))
+        {
+            CopyFile(sourcePath, destinationPath);
+            return;
+        }
+
+        // A rename keeps the ACL the file had in %TEMP%; a copy would have inherited the output directory's
+        if (OperatingSystem.IsWindows())
+            InheritAccessControl(destinationPath);
+    }
+
+    /// <summary>
+    /// Copies with the OS copy primitive, falling back to a buffered stream copy on file systems that reject it
+    /// (some network shares and FUSE mounts).
+    /// </summary>
+    public static void CopyFile(string sourcePath, string destinationPath)
+    {
+        try
+        {
+            File.Copy(sourcePath, destinationPath, overwrite: true);
+        }
+        catch (IOException ex) when (IsCopyUnsupported(ex))
+        {
+            using var source = new FileStream(sourcePath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete, CopyBufferSize, FileOptions.SequentialScan);
+            // Reserve the full size up front so the executable is laid out in as few extents as possible
+            using var destination = new FileStream(destinationPath, new FileStreamOptions
+            {
+                Mode = FileMode.Create,
+                Access = FileAccess.Write,
+                Share = FileShare.None,
+                BufferSize = CopyBufferSize,
+                PreallocationSize = source.Length
+            });
+            source.CopyTo(destination, CopyBufferSize);
+        }
+    }
+
+    // IOException.HResult is HRESULT_FROM_WIN32(code) on Windows and the raw errno elsewhere
+    private static int GetErrorCode(IOException ex) => OperatingSystem.IsWindows() ? ex.HResult & 0xFFFF : ex.HResult;
+
+    /// <summary>
+    /// The move failed because the source is still open (sharing/lock violation or access denied), not because
+    /// of the destination or the disk; those would fail the copy too, after it had truncated the destination.
+    /// </summary>
+    private static bool IsSourceInUse(Exception ex) => ex switch
+    {
+        UnauthorizedAccessException => true,
+        IOException io when OperatingSystem.IsWindows() => GetErrorCode(io) is ErrorSharingViolation or ErrorLockViolation,
+        _ => false
+    };
+
+    /// <summary>
+    /// The file system doesn't support the OS copy call. Anything else (disk full, locked destination, missing
+    /// source) is rethrown rather than retried with a stream copy that truncates the destination first.
+    /// </summary>
+    private static bool IsCopyUnsupported(IOException ex) => OperatingSystem.IsWindows()
+        ? GetErrorCode(ex) is ErrorInvalidFunction or ErrorNotSupported or ErrorInvalidParameter
+        : GetErrorCode(ex) is Enosys or Eopnotsupp or Einval or Exdev;
+
+    [SupportedOSPlatform("windows")]
+    private static void InheritAccessControl(string path)
+    {
+        try
+        {
+            // No explicit entries, DACL unprotected: Windows fills it from the parent directory's inheritable entries
+            var security = new FileSecurity();
+            security.SetAccessRuleProtection(isProtected: false, preserveInheritance: false);
+            new FileInfo(path).SetAccessControl(security);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            // Best effort: the file keeps its %TEMP% ACL, which still grants the user who built it full access
+        }
+    }
+
+    /// <summary>
+    /// Lower-case hex SHA-256 of a file. SHA256.HashDataAsync uses the platform's hardware-accelerated
+    /// implementation; the large sequential-scan reads keep a 70 MB network at a few dozen reads.
+    /// </summary>
+    public static async Task<string> ComputeSha256Async(string path, CancellationToken cancellationToken = default)
+    {
+        await using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, CopyBufferSize, FileOptions.Asynchronous | FileOptions.SequentialScan);
+        var hash = await SHA256.HashDataAsync(stream, cancellationToken);
+        return Convert.ToHexString(hash).ToLowerInvariant();
+    }
+
+    /// <summary>
+    /// Recursively deletes a directory. A Stockfish source tree holds thousands of small files, so the files are
+    /// unlinked in parallel first and the then-empty directory tree is removed in one pass.
+    /// </summary>
+    public static void DeleteDirectory(string path)
+    {
+        var directory = new DirectoryInfo(path);
+        if (!directory.Exists)
+            return;
+
+        // Never enter symlinks or junctions: their targets live outside this tree. The final recursive delete
+        // removes the links themselves without following them. Hidden/system files are still included.
+        var files = directory.EnumerateFiles("*", new EnumerationOptions { RecurseSubdirectories = true, AttributesToSkip = FileAttributes.ReparsePoint });
+        Parallel.ForEach(files, new ParallelOptions { MaxDegreeOfParallelism = MaxDeleteParallelism }, file =>
+        {
+            try
+            {
+                if (file.Attributes.HasFlag(FileAttributes.ReadOnly))
+                    file.Attributes = FileAttributes.Normal;
+                file.Delete();
+            }
+            catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+            {
+                // Left for the recursive delete below, which reports the failure to the caller
+            }
+        });
+
+        directory.Delete(recursive: true);
+    }
+}
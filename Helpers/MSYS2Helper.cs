@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
 using System.IO;
 using System.Runtime.InteropServices;
 using StockfishCompiler.Models;
@@ -6,6 +8,18 @@ namespace StockfishCompiler.Helpers;
 
 public static class MSYS2Helper
 {
+    // Keyed by compiler path ("" when none); the build and network steps resolve make for the same compiler repeatedly
+    private static readonly ConcurrentDictionary<string, string> MakeExecutableCache = new(StringComparer.OrdinalIgnoreCase);
+
+    // Resolved MSYS2 root and existing bin directories per compiler path; only successful lookups are kept
+    // so installing MSYS2 while the app is running is still picked up
+    private static readonly ConcurrentDictionary<string, MSYS2Layout> LayoutCache = new(StringComparer.OrdinalIgnoreCase);
+
+    private readonly record struct MSYS2Layout(string Root, string[] BinPaths);
+
+    // The app never changes its own environment, so read it once instead of re-parsing it for every build and probe
+    private static readonly Lazy<Dictionary<string, string>> ProcessEnvironment = new(ReadProcessEnvironment);
+
     public static string[] GetCommonMSYS2Paths() =>
     [
         @"C:\msys64",
@@ -25,27 +39,22 @@ public static class MSYS2Helper
         if (!RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
             return "make";
 
-        // Try to find make near the compiler first - this ensures we use the same MSYS2 installation
-        if (!string.IsNullOrEmpty(compilerPath))
-        {
-            var compilerDir = new DirectoryInfo(compilerPath);
-            
-            // Walk up to find MSYS2 root (compiler is in e.g. msys64/mingw64/bin)
-            var potentialRoot = compilerDir.Parent?.Parent;
-            
-            if (potentialRoot != null && potentialRoot.Exists && IsValidMSYS2Installation(potentialRoot.FullName))
-            {
-                // Prefer usr/bin/make.exe as it's the standard location
-                var usrMake = Path.Combine(potentialRoot.FullName, "usr", "bin", "make.exe");
-                if (File.Exists(usrMake))
-                    return usrMake;
-                    
-                // Also check mingw64/bin for mingw32-make
-                var mingwMake = Path.Combine(potentialRoot.FullName, "mingw64", "bin", "mingw32-make.exe");
-                if (File.Exists(mingwMake))
-                    return mingwMake;
-            }
-        }
+        var key = compilerPath ?? string.Empty;
+        if (MakeExecutableCache.TryGetValue(key, out var cached) && File.Exists(cached))
+            return cached;
+
+        var makePath = LocateMakeExecutable(compilerPath);
+        if (makePath != "make")
+            MakeExecutableCache[key] = makePath;
+
+        return makePath;
+    }
+
+    private static string LocateMakeExecutable(string? compilerPath)
+    {
+        // Use the installation the compiler belongs to; a valid one always has usr/bin/make.exe
+        if (GetLayout(compilerPath) is { } layout)
+            return Path.Combine(layout.Root, "usr", "bin", "make.exe");
 
         // Try common MSYS2 paths as fallback
         foreach (var msys2Path in GetCommonMSYS2Paths())
@@ -71,51 +80,18 @@ public static class MSYS2Helper
 
     public static Dictionary<string, string> SetupEnvironment(BuildConfiguration? config = null)
     {
-        var env = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
-        
         // Copy existing environment
-        foreach (System.Collections.DictionaryEntry entry in Environment.GetEnvironmentVariables())
-        {
-            if (entry.Key is string key && entry.Value is string value)
-                env[key] = value;
-        }
+        var env = new Dictionary<string, string>(ProcessEnvironment.Value, StringComparer.OrdinalIgnoreCase);
 
         if (!RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
             return env;
 
         var pathsToAdd = new List<string>();
-        string? msys2Root = null;
-
-        // Try to determine MSYS2 root from compiler path - this ensures consistency
-        if (config?.SelectedCompiler?.Path != null)
-        {
-            var compilerDir = new DirectoryInfo(config.SelectedCompiler.Path);
-            var potentialRoot = compilerDir.Parent?.Parent;
-            
-            if (potentialRoot != null && potentialRoot.Exists && IsValidMSYS2Installation(potentialRoot.FullName))
-            {
-                msys2Root = potentialRoot.FullName;
-            }
-        }
-
-        // If no root found from compiler, try common paths
-        if (string.IsNullOrEmpty(msys2Root))
-        {
-            msys2Root = FindMSYS2Installation();
-        }
 
         // Add MSYS2 paths if found
-        if (!string.IsNullOrEmpty(msys2Root))
+        if (GetLayout(config?.SelectedCompiler?.Path) is { } layout)
         {
-            // Add paths in order of preference
-            var usrBin = Path.Combine(msys2Root, "usr", "bin");
-            var mingw64Bin = Path.Combine(msys2Root, "mingw64", "bin");
-            
-            // mingw64/bin should come first so mingw tools are preferred
-            if (Directory.Exists(mingw64Bin))
-                pathsToAdd.Add(mingw64Bin);
-            if (Directory.Exists(usrBin))
-                pathsToAdd.Add(usrBin);
+            pathsToAdd.AddRange(layout.BinPaths);
                 
             // Set MSYSTEM environment variable for proper MSYS2 operation
             env["MSYSTEM"] = "MINGW64";
@@ -132,22 +108,81 @@ public static class MSYS2Helper
         // Update PATH if we found MSYS2 paths
         if (pathsToAdd.Count > 0)
         {
-            var currentPath = env.GetValueOrDefault("PATH", string.Empty);
-            env["PATH"] = string.Join(";", pathsToAdd) + ";" + currentPath;
+            pathsToAdd.Add(env.GetValueOrDefault("PATH", string.Empty));
+            env["PATH"] = string.Join(Path.PathSeparator, pathsToAdd);
         }
 
         return env;
     }
 
+    /// <summary>
+    /// Copies <paramref name="env"/> into a child process's environment. ProcessStartInfo already starts from
+    /// this process's environment, so only the variables SetupEnvironment or the caller changed are written.
+    /// </summary>
+    public static void ApplyEnvironment(ProcessStartInfo startInfo, IReadOnlyDictionary<string, string> env)
+    {
+        var inherited = ProcessEnvironment.Value;
+        foreach (var kvp in env)
+        {
+            if (!inherited.TryGetValue(kvp.Key, out var value) || value != kvp.Value)
+                startInfo.EnvironmentVariables[kvp.Key] = kvp.Value;
+        }
+    }
+
+    private static Dictionary<string, string> ReadProcessEnvironment()
+    {
+        var env = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+        foreach (System.Collections.DictionaryEntry entry in Environment.GetEnvironmentVariables())
+        {
+            if (entry.Key is string key && entry.Value is string value)
+                env[key] = value;
+        }
+        return env;
+    }
+
+    /// <summary>
+    /// Resolves the MSYS2 root from the compiler path (compiler is in e.g. msys64/mingw64/bin), falling back to common locations.
+    /// </summary>
+    private static MSYS2Layout? GetLayout(string? compilerPath)
+    {
+        var key = compilerPath ?? string.Empty;
+        if (LayoutCache.TryGetValue(key, out var cached))
+            return cached;
+
+        string? msys2Root = null;
+
+        // Try to determine MSYS2 root from compiler path - this ensures consistency
+        if (!string.IsNullOrEmpty(compilerPath))
+        {
+            var potentialRoot = new DirectoryInfo(compilerPath).Parent?.Parent;
+            if (potentialRoot != null && IsValidMSYS2Installation(potentialRoot.FullName))
+                msys2Root = potentialRoot.FullName;
+        }
+
+        // If no root found from compiler, try common paths
+        msys2Root ??= FindMSYS2Installation();
+        if (string.IsNullOrEmpty(msys2Root))
+            return null;
+
+        // mingw64/bin should come first so mingw tools are preferred; usr/bin is guaranteed by the validity check
+        var mingw64Bin = Path.Combine(msys2Root, "mingw64", "bin");
+        var usrBin = Path.Combine(msys2Root, "usr", "bin");
+        string[] binPaths = Directory.Exists(mingw64Bin) ? [mingw64Bin, usrBin] : [usrBin];
+
+        var layout = new MSYS2Layout(msys2Root, binPaths);
+        LayoutCache[key] = layout;
+        return layout;
+    }
+
     public static bool IsValidMSYS2Installation(string path)
     {
-        if (string.IsNullOrWhiteSpace(path) || !Directory.Exists(path))
+        if (string.IsNullOrWhiteSpace(path))
             return false;
 
-        var usrBin = Path.Combine(path, "usr", "bin");
-        var makeExe = Path.Combine(usrBin, "make.exe");
+        // make.exe existing implies usr/bin and the root exist, so skip stat-ing those separately
+        var makeExe = Path.Combine(path, "usr", "bin", "make.exe");
         var mingw64 = Path.Combine(path, "mingw64");
 
-        return Directory.Exists(usrBin) && Directory.Exists(mingw64) && File.Exists(makeExe);
+        return File.Exists(makeExe) && Directory.Exists(mingw64);
     }
 }
@@ -1,4 +1,5 @@
 using System;
+using System.IO;
 using System.Runtime.InteropServices;
 using Microsoft.Win32;
 
@@ -6,6 +7,165 @@ namespace StockfishCompiler.Helpers;
 
 public static class OSHelper
 {
+    private const int RelationProcessorCore = 0;
+    private const uint PF_ARM_V82_DP_INSTRUCTIONS_AVAILABLE = 43;
+
+    private static readonly Lazy<int> PhysicalCoreCount = new(DetectPhysicalCoreCount);
+
+    [StructLayout(LayoutKind.Sequential)]
+    private struct MemoryStatusEx
+    {
+        public uint Length;
+        public uint MemoryLoad;
+        public ulong TotalPhys;
+        public ulong AvailPhys;
+        public ulong TotalPageFile;
+        public ulong AvailPageFile;
+        public ulong TotalVirtual;
+        public ulong AvailVirtual;
+        public ulong AvailExtendedVirtual;
+    }
+
+    [DllImport("kernel32.dll", SetLastError = true)]
+    [return: MarshalAs(UnmanagedType.Bool)]
+    private static extern bool GetLogicalProcessorInformationEx(int relationshipType, IntPtr buffer, ref uint returnedLength);
+
+    [DllImport("kernel32.dll", SetLastError = true)]
+    [return: MarshalAs(UnmanagedType.Bool)]
+    private static extern bool GlobalMemoryStatusEx(ref MemoryStatusEx buffer);
+
+    [DllImport("kernel32.dll")]
+    [return: MarshalAs(UnmanagedType.Bool)]
+    private static extern bool IsProcessorFeaturePresent(uint processorFeature);
+
+    /// <summary>
+    /// Number of physical cores (SMT siblings counted once). Falls back to the logical count.
+    /// </summary>
+    public static int GetPhysicalCoreCount() => PhysicalCoreCount.Value;
+
+    /// <summary>
+    /// True when the machine's ARM64 CPU has the ARMv8.2 dot-product instructions. On Windows this asks the OS,
+    /// which also works when the app runs as emulated x64; elsewhere it needs a native ARM64 process.
+    /// </summary>
+    public static bool IsArm64DotProductSupported()
+    {
+        if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
+            return IsProcessorFeaturePresent(PF_ARM_V82_DP_INSTRUCTIONS_AVAILABLE);
+
+        return System.Runtime.Intrinsics.Arm.Dp.IsSupported;
+    }
+
+    /// <summary>
+    /// Physical memory currently available to new processes, or null if it cannot be determined.
+    /// </summary>
+    public static long? GetAvailableMemoryBytes()
+    {
+        try
+        {
+            if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
+            {
+                var status = new MemoryStatusEx { Length = (uint)Marshal.SizeOf<MemoryStatusEx>() };
+                return GlobalMemoryStatusEx(ref status) ? (long)status.AvailPhys : null;
+            }
+
+            if (RuntimeInformation.IsOSPlatform(OSPlatform.Linux))
+            {
+                foreach (var line in File.ReadLines("/proc/meminfo"))
+                {
+                    if (!line.StartsWith("MemAvailable:", StringComparison.Ordinal))
+                        continue;
+
+                    var parts = line.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+                    if (parts.Length >= 2 && long.TryParse(parts[1], out var kb))
+                        return kb * 1024;
+                }
+            }
+        }
+        catch
+        {
+            // Unknown memory state; callers skip the memory cap
+        }
+
+        return null;
+    }
+
+    private static int DetectPhysicalCoreCount()
+    {
+        int? cores = null;
+
+        try
+        {
+            if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
+                cores = CountWindowsProcessorCores();
+            else if (RuntimeInformation.IsOSPlatform(OSPlatform.Linux))
+                cores = CountLinuxProcessorCores();
+        }
+        catch
+        {
+            // Fall through to the logical processor count
+        }
+
+        return cores is > 0 ? Math.Min(cores.Value, Environment.ProcessorCount) : Environment.ProcessorCount;
+    }
+
+    private static int? CountWindowsProcessorCores()
+    {
+        uint length = 0;
+        GetLogicalProcessorInformationEx(RelationProcessorCore, IntPtr.Zero, ref length);
+        if (length == 0)
+            return null;
+
+        var buffer = Marshal.AllocHGlobal((int)length);
+        try
+        {
+            if (!GetLogicalProcessorInformationEx(RelationProcessorCore, buffer, ref length))
+                return null;
+
+            // Each variable-sized record starts with { int Relationship; uint Size; }
+            var count = 0;
+            var offset = 0;
+            while (offset < length)
+            {
+                var size = Marshal.ReadInt32(buffer, offset + 4);
+                if (size <= 0)
+                    break;
+
+                if (Marshal.ReadInt32(buffer, offset) == RelationProcessorCore)
+                    count++;
+                offset += size;
+            }
+
+            return count;
+        }
+        finally
+        {
+            Marshal.FreeHGlobal(buffer);
+        }
+    }
+
+    private static int? CountLinuxProcessorCores()
+    {
+        var cores = new HashSet<(string, string)>();
+        string physicalId = "0";
+
+        foreach (var line in File.ReadLines("/proc/cpuinfo"))
+        {
+            var separator = line.IndexOf(':');
+            if (separator < 0)
+                continue;
+
+            var key = line[..separator].Trim();
+            var value = line[(separator + 1)..].Trim();
+
+            if (key == "physical id")
+                physicalId = value;
+            else if (key == "core id")
+                cores.Add((physicalId, value));
+        }
+
+        return cores.Count > 0 ? cores.Count : null;
+    }
+
     public static string GetFriendlyOSName()
     {
         if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
@@ -1,3 +1,5 @@
+using StockfishCompiler.Helpers;
+
 namespace StockfishCompiler.Models;
 
 public class BuildConfiguration
@@ -8,6 +10,8 @@ public class BuildConfiguration
     public bool DownloadNetwork { get; set; } = true;
     public bool StripExecutable { get; set; } = true;
     public bool EnablePgo { get; set; } = true;
-    public int ParallelJobs { get; set; } = Environment.ProcessorCount;
+    public bool UseCompilerCache { get; set; } = true;
+    public bool TargetsNativeCpu { get; set; } // true when the selected architecture is the one auto-detected for this machine
+    public int ParallelJobs { get; set; } = OSHelper.GetPhysicalCoreCount();
     public string OutputDirectory { get; set; } = string.Empty;
 }
@@ -0,0 +1,49 @@
+using StockfishCompiler.Constants;
+
+namespace StockfishCompiler.Models;
+
+/// <summary>
+/// Command-line overrides, e.g. <c>--release</c>, <c>--dev</c>, <c>--source=sf_17</c>, <c>--arch=x86-64-avx2</c>.
+/// <c>--source</c> takes master, stable or a release tag; the view model ignores anything else.
+/// <c>--yes</c> (or <c>--build</c>) builds unattended and exits with the build's result.
+/// </summary>
+public class StartupOptions
+{
+    public string? SourceVersion { get; set; }
+    public string? Architecture { get; set; }
+    public bool Unattended { get; set; }
+
+    public static StartupOptions Parse(IEnumerable<string> args)
+    {
+        var options = new StartupOptions();
+
+        foreach (var arg in args)
+        {
+            var separator = arg.IndexOf('=');
+            var name = (separator < 0 ? arg : arg[..separator]).ToLowerInvariant();
+            var value = separator < 0 ? null : arg[(separator + 1)..].Trim();
+
+            switch (name)
+            {
+                case "--release":
+                    options.SourceVersion = SourceVersions.Stable;
+                    break;
+                case "--dev":
+                    options.SourceVersion = SourceVersions.Master;
+                    break;
+                case "--source" when !string.IsNullOrWhiteSpace(value):
+                    options.SourceVersion = value;
+                    break;
+                case "--yes":
+                case "--build":
+                    options.Unattended = true;
+                    break;
+                case "--arch" when !string.IsNullOrWhiteSpace(value):
+                    options.Architecture = value;
+                    break;
+            }
+        }
+
+        return options;
+    }
+}
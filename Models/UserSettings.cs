@@ -1,4 +1,5 @@
 using System;
+using StockfishCompiler.Helpers;
 
 namespace StockfishCompiler.Models;
 
@@ -7,7 +8,9 @@ public class UserSettings
     public bool DownloadNetwork { get; set; } = true;
     public bool StripExecutable { get; set; } = true;
     public bool EnablePgo { get; set; } = true;
-    public int ParallelJobs { get; set; } = Environment.ProcessorCount;
+    public bool UseCompilerCache { get; set; } = true;
+    public int ParallelJobs { get; set; } = OSHelper.GetPhysicalCoreCount();
     public string OutputDirectory { get; set; } = Environment.GetFolderPath(Environment.SpecialFolder.Desktop);
     public string SourceVersion { get; set; } = "stable"; // Can be "master", "stable", or a specific tag like "sf_17"
+    public CompilerInfo? LastCompiler { get; set; } // Restored on startup so a full detection scan isn't needed every run
 }
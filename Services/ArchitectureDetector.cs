@@ -1,5 +1,8 @@
+using System.Collections.Concurrent;
 using System.Diagnostics;
 using System.Runtime.InteropServices;
+using System.Runtime.Intrinsics.X86;
+using System.Text.RegularExpressions;
 using System.IO;
 using System.Threading;
 using Microsoft.Extensions.Logging;
@@ -8,15 +11,37 @@ using StockfishCompiler.Models;
 
 namespace StockfishCompiler.Services;
 
-public class ArchitectureDetector : IArchitectureDetector
+public partial class ArchitectureDetector : IArchitectureDetector
 {
     private static readonly string[] X64BaseFeatures = ["sse4.1", "popcnt", "avx2", "bmi2"];
     private static readonly string[] Arm64BaseFeatures = ["neon", "popcnt"];
+
+    // The app ships as win-x64, so on Windows on ARM it runs emulated; the build target is the machine's CPU
+    private static bool IsArm64Machine => RuntimeInformation.OSArchitecture == Architecture.Arm64;
     private readonly ILogger<ArchitectureDetector> _logger;
 
+    // CPU features can't change while the app runs: read the hardware once, and probe each compiler at most once
+    private readonly Lazy<(List<string> Features, string CpuName)?> _hardwareFeatures;
+    private readonly ConcurrentDictionary<string, (List<string> Features, string CpuName)> _compilerProbeCache = new(StringComparer.OrdinalIgnoreCase);
+
+    // gcc -Q --help=target lines look like "  -mavx2    [enabled]" and "  -march=    skylake"
+    [GeneratedRegex(@"^\s*-m([\w.\-]+)\s+\[enabled\]", RegexOptions.Multiline)]
+    private static partial Regex GccEnabledFeatureRegex();
+
+    [GeneratedRegex(@"^\s*-march=\s+(\S+)", RegexOptions.Multiline)]
+    private static partial Regex GccMarchRegex();
+
+    // clang -### prints every cc1 argument quoted on a single line
+    [GeneratedRegex(@"""-target-feature""\s+""\+([^""]+)""")]
+    private static partial Regex ClangTargetFeatureRegex();
+
+    [GeneratedRegex(@"""-target-cpu""\s+""([^""]+)""")]
+    private static partial Regex ClangTargetCpuRegex();
+
     public ArchitectureDetector(ILogger<ArchitectureDetector> logger)
     {
         _logger = logger;
+        _hardwareFeatures = new Lazy<(List<string> Features, string CpuName)?>(DetectHardwareFeatures);
     }
 
     public async Task<ArchitectureInfo> DetectOptimalArchitectureAsync(CompilerInfo compiler, CancellationToken cancellationToken = default)
@@ -37,7 +62,7 @@ public class ArchitectureDetector : IArchitectureDetector
                 Id = archId, 
                 Name = archId, 
                 Description = archId, 
-                Category = RuntimeInformation.ProcessArchitecture == Architecture.Arm64 ? "ARM" : "x86" 
+                Category = IsArm64Machine ? "ARM" : "x86" 
             };
         }
         catch (Exception ex)
@@ -45,7 +70,7 @@ public class ArchitectureDetector : IArchitectureDetector
             _logger.LogError(ex, "Architecture detection failed for {Compiler}, using fallback", compiler.DisplayName);
             
             // Fallback to safe generic architecture based on platform
-            var fallbackId = RuntimeInformation.ProcessArchitecture == Architecture.Arm64 
+            var fallbackId = IsArm64Machine 
                 ? "armv8" 
                 : "x86-64";
             
@@ -57,7 +82,7 @@ public class ArchitectureDetector : IArchitectureDetector
                 Id = fallbackId,
                 Name = fallbackId,
                 Description = $"{fallbackId} (fallback - detection failed)",
-                Category = RuntimeInformation.ProcessArchitecture == Architecture.Arm64 ? "ARM" : "x86",
+                Category = IsArm64Machine ? "ARM" : "x86",
                 IsRecommended = false
             };
         }
@@ -73,22 +98,12 @@ public class ArchitectureDetector : IArchitectureDetector
     {
         try
         {
-            if (RuntimeInformation.ProcessArchitecture == Architecture.Arm64)
-            {
-                _logger.LogInformation("ARM64 architecture detected, using base features");
-                return (Arm64BaseFeatures.ToList(), "arm64");
-            }
+            // Callers get their own copy of the feature list so the cached one can't be modified
+            if (_hardwareFeatures.Value is { } hardware)
+                return (await CapToCompilerAsync(hardware.Features, compiler, cancellationToken), hardware.CpuName);
 
-            if (compiler.Type is "gcc" or "mingw")
-            {
-                _logger.LogDebug("Using GCC feature detection for {Compiler}", compiler.DisplayName);
-                return await DetectGccFeaturesAsync(compiler, cancellationToken);
-            }
-            if (compiler.Type == "clang")
-            {
-                _logger.LogDebug("Using Clang feature detection for {Compiler}", compiler.DisplayName);
-                return await DetectClangFeaturesAsync(compiler, cancellationToken);
-            }
+            if (await ProbeCompilerFeaturesAsync(compiler, cancellationToken) is { } probed)
+                return (probed.Features.ToList(), probed.CpuName);
             
             _logger.LogWarning("Unknown compiler type: {Type}, using fallback", compiler.Type);
         }
@@ -100,6 +115,156 @@ public class ArchitectureDetector : IArchitectureDetector
         return GetFallbackFeatures();
     }
 
+    /// <summary>
+    /// CPUID says what the CPU runs, not what the compiler can target: an old MinGW g++ rejects the VNNI and
+    /// AVX-512 ARCHes. x86 hardware features are therefore limited to those the compiler enables for -march=native.
+    /// </summary>
+    private async Task<List<string>> CapToCompilerAsync(List<string> hardwareFeatures, CompilerInfo compiler, CancellationToken cancellationToken)
+    {
+        if (IsArm64Machine)
+            return hardwareFeatures.ToList();
+
+        try
+        {
+            if (await ProbeCompilerFeaturesAsync(compiler, cancellationToken) is { } probed)
+            {
+                var capped = hardwareFeatures.Intersect(probed.Features, StringComparer.OrdinalIgnoreCase).ToList();
+                if (capped.Count < hardwareFeatures.Count)
+                    _logger.LogInformation("{Compiler} does not support CPU features: {Features}",
+                        compiler.DisplayName, string.Join(", ", hardwareFeatures.Except(capped, StringComparer.OrdinalIgnoreCase)));
+                return capped;
+            }
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogWarning(ex, "Compiler feature probe failed, using CPUID features as-is");
+        }
+
+        return hardwareFeatures.ToList();
+    }
+
+    /// <summary>
+    /// Asks the compiler which features it enables for -march=native, once per compiler; null for compilers it can't ask.
+    /// </summary>
+    private async Task<(List<string> Features, string CpuName)?> ProbeCompilerFeaturesAsync(CompilerInfo compiler, CancellationToken cancellationToken)
+    {
+        var cacheKey = Path.Combine(compiler.Path, compiler.Name);
+        if (_compilerProbeCache.TryGetValue(cacheKey, out var cached))
+        {
+            _logger.LogDebug("Using cached feature probe for {Compiler}", compiler.DisplayName);
+            return cached;
+        }
+
+        (List<string> Features, string CpuName)? probed = null;
+        if (compiler.Type is "gcc" or "mingw")
+        {
+            _logger.LogDebug("Using GCC feature detection for {Compiler}", compiler.DisplayName);
+            probed = await DetectGccFeaturesAsync(compiler, cancellationToken);
+        }
+        else if (compiler.Type == "clang")
+        {
+            _logger.LogDebug("Using Clang feature detection for {Compiler}", compiler.DisplayName);
+            probed = await DetectClangFeaturesAsync(compiler, cancellationToken);
+        }
+
+        if (probed is { } result)
+            _compilerProbeCache[cacheKey] = result;
+        return probed;
+    }
+
+    /// <summary>
+    /// Reads features from the runtime (ARM64) or CPUID (x86); null when only compiler probing is available.
+    /// </summary>
+    private (List<string> Features, string CpuName)? DetectHardwareFeatures()
+    {
+        if (IsArm64Machine)
+        {
+            _logger.LogInformation("ARM64 machine detected, querying ISA support");
+            return DetectArm64Features();
+        }
+
+        // Read the feature bits straight from CPUID; only fall back to compiler probing when unavailable
+        if (X86Base.IsSupported)
+        {
+            _logger.LogDebug("Using CPUID feature detection");
+            return DetectCpuIdFeatures();
+        }
+
+        return null;
+    }
+
+    /// <summary>
+    /// Detects ARM64 extensions from the OS, so an emulated x64 process still sees the real CPU.
+    /// </summary>
+    private static (List<string> Features, string CpuName) DetectArm64Features()
+    {
+        var features = Arm64BaseFeatures.ToList();
+        if (OSHelper.IsArm64DotProductSupported())
+            features.Add("dotprod");
+
+        return (features, RuntimeInformation.IsOSPlatform(OSPlatform.OSX) ? "apple" : "arm64");
+    }
+
+    /// <summary>
+    /// Detects x86 features from CPUID leaves 1 and 7, using GCC feature names so the mapping table is shared.
+    /// </summary>
+    private static (List<string> Features, string CpuName) DetectCpuIdFeatures()
+    {
+        var features = new List<string>();
+        void AddIf(bool present, string name)
+        {
+            if (present)
+                features.Add(name);
+        }
+        static bool Bit(int register, int bit) => (register & (1 << bit)) != 0;
+
+        var (maxLeaf, vendorEbx, vendorEcx, vendorEdx) = X86Base.CpuId(0, 0);
+        Span<byte> vendorBytes = stackalloc byte[12];
+        BitConverter.TryWriteBytes(vendorBytes[..4], vendorEbx);
+        BitConverter.TryWriteBytes(vendorBytes[4..8], vendorEdx);
+        BitConverter.TryWriteBytes(vendorBytes[8..], vendorEcx);
+        var vendor = System.Text.Encoding.ASCII.GetString(vendorBytes);
+
+        var (signature, _, leaf1Ecx, _) = X86Base.CpuId(1, 0);
+        AddIf(Bit(leaf1Ecx, 0), "sse3");
+        AddIf(Bit(leaf1Ecx, 9), "ssse3");
+        AddIf(Bit(leaf1Ecx, 19), "sse4.1");
+        AddIf(Bit(leaf1Ecx, 20), "sse4.2");
+        AddIf(Bit(leaf1Ecx, 23), "popcnt");
+
+        // AVX state must also be enabled by the OS; the runtime's IsSupported checks cover XCR0
+        var osAvx = Avx.IsSupported;
+        var osAvx512 = Avx512F.IsSupported;
+        AddIf(osAvx, "avx");
+
+        if (maxLeaf >= 7)
+        {
+            var (_, leaf7Ebx, leaf7Ecx, _) = X86Base.CpuId(7, 0);
+            AddIf(Bit(leaf7Ebx, 3), "bmi");
+            AddIf(Bit(leaf7Ebx, 8), "bmi2");
+            AddIf(osAvx && Bit(leaf7Ebx, 5), "avx2");
+            AddIf(osAvx512 && Bit(leaf7Ebx, 16), "avx512f");
+            AddIf(osAvx512 && Bit(leaf7Ebx, 17), "avx512dq");
+            AddIf(osAvx512 && Bit(leaf7Ebx, 30), "avx512bw");
+            AddIf(osAvx512 && Bit(leaf7Ebx, 31), "avx512vl");
+            AddIf(osAvx512 && Bit(leaf7Ecx, 11), "avx512vnni");
+        }
+
+        var family = (signature >> 8) & 0xF;
+        var model = (signature >> 4) & 0xF;
+        if (family == 0xF)
+            family += (signature >> 20) & 0xFF;
+        if (family >= 6)
+            model |= ((signature >> 16) & 0xF) << 4;
+
+        // Zen 1/2 (family 17h) implement PDEP/PEXT in microcode, which DetermineOptimalArchitecture avoids
+        var cpuName = vendor == "AuthenticAMD" && family == 0x17
+            ? (model < 0x30 ? "znver1" : "znver2")
+            : $"{vendor} family {family:X}h model {model:X}h";
+
+        return (features, cpuName);
+    }
+
     private async Task<(List<string> Features, string CpuName)> DetectGccFeaturesAsync(CompilerInfo compiler, CancellationToken cancellationToken)
     {
         var exe = Path.Combine(compiler.Path, compiler.Name);
@@ -122,10 +287,7 @@ public class ArchitectureDetector : IArchitectureDetector
         });
         env["LC_ALL"] = "C";
         env["LANG"] = "C";
-        foreach (var kvp in env)
-        {
-            psi.EnvironmentVariables[kvp.Key] = kvp.Value;
-        }
+        MSYS2Helper.ApplyEnvironment(psi, env);
 
         psi.ArgumentList.Add("-Q");
         psi.ArgumentList.Add("-march=native");
@@ -167,31 +329,9 @@ public class ArchitectureDetector : IArchitectureDetector
             throw new InvalidOperationException(errorMessage);
         }
 
-        var features = new List<string>();
-        string cpuName = "";
-        foreach (var line in stdout.Split('\n'))
-        {
-            var trimmed = line.Trim();
-            if (trimmed.StartsWith("-march", StringComparison.Ordinal))
-            {
-                var parts = trimmed.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-                cpuName = parts.LastOrDefault() ?? string.Empty;
-            }
-            if (trimmed.Contains("[enabled]"))
-            {
-                if (!trimmed.Contains("-m", StringComparison.Ordinal))
-                    continue;
-
-                var flag = trimmed.Split(' ', StringSplitOptions.RemoveEmptyEntries)
-                                  .FirstOrDefault(s => s.StartsWith("-m", StringComparison.Ordinal));
-                if (!string.IsNullOrWhiteSpace(flag))
-                {
-                    var name = flag.Length > 2 ? flag[2..] : flag;
-                    if (!string.IsNullOrWhiteSpace(name))
-                        features.Add(name);
-                }
-            }
-        }
+        var features = GccEnabledFeatureRegex().Matches(stdout).Select(m => m.Groups[1].Value).ToList();
+        var marchMatch = GccMarchRegex().Match(stdout);
+        string cpuName = marchMatch.Success ? marchMatch.Groups[1].Value : "";
 
         _logger.LogDebug("GCC detection found {Count} features", features.Count);
         var distinct = features.Distinct(StringComparer.OrdinalIgnoreCase).ToList();
@@ -224,10 +364,7 @@ public class ArchitectureDetector : IArchitectureDetector
         });
         env["LC_ALL"] = "C";
         env["LANG"] = "C";
-        foreach (var kvp in env)
-        {
-            psi.EnvironmentVariables[kvp.Key] = kvp.Value;
-        }
+        MSYS2Helper.ApplyEnvironment(psi, env);
 
         psi.ArgumentList.Add("-E");
         psi.ArgumentList.Add("-");
@@ -250,28 +387,9 @@ public class ArchitectureDetector : IArchitectureDetector
         var stdout = await stdoutTask;
         var stderr = await stderrTask;
 
-        var features = new List<string>();
-        string cpuName = "";
-        foreach (var line in stderr.Split('\n'))
-        {
-            var trimmed = line.Trim();
-            if (trimmed.Contains("-target-cpu"))
-            {
-                var parts = trimmed.Split('"');
-                cpuName = parts.LastOrDefault() ?? string.Empty;
-            }
-            if (trimmed.Contains("-target-feature"))
-            {
-                var parts = trimmed.Split('"');
-                var feat = parts.LastOrDefault();
-                if (!string.IsNullOrEmpty(feat) && feat.StartsWith('+'))
-                {
-                    var name = feat.Length > 1 ? feat[1..] : feat;
-                    if (!string.IsNullOrWhiteSpace(name))
-                        features.Add(name);
-                }
-            }
-        }
+        var features = ClangTargetFeatureRegex().Matches(stderr).Select(m => m.Groups[1].Value).ToList();
+        var cpuMatch = ClangTargetCpuRegex().Match(stderr);
+        string cpuName = cpuMatch.Success ? cpuMatch.Groups[1].Value : "";
 
         _logger.LogDebug("Clang detection found {Count} features", features.Count);
         var distinct = features.Distinct(StringComparer.OrdinalIgnoreCase).ToList();
@@ -288,8 +406,12 @@ public class ArchitectureDetector : IArchitectureDetector
         bool Has(params string[] req) => req.All(f => features.Contains(f));
         string cpu = cpuName.ToLowerInvariant();
 
-        if (RuntimeInformation.ProcessArchitecture == Architecture.Arm64)
-            return "armv8";
+        if (IsArm64Machine)
+        {
+            if (cpu == "apple")
+                return "apple-silicon";
+            return Has("dotprod") ? "armv8-dotprod" : "armv8";
+        }
 
         if (Has("avx512vnni", "avx512dq", "avx512f", "avx512bw", "avx512vl"))
             return "x86-64-vnni256";
@@ -310,13 +432,13 @@ public class ArchitectureDetector : IArchitectureDetector
 
     private (List<string> Features, string CpuName) GetFallbackFeatures()
     {
-        var features = RuntimeInformation.ProcessArchitecture switch
+        var features = RuntimeInformation.OSArchitecture switch
         {
             Architecture.X64 => X64BaseFeatures.ToList(),
             Architecture.Arm64 => Arm64BaseFeatures.ToList(),
             _ => new List<string>()
         };
-        return (features, RuntimeInformation.ProcessArchitecture.ToString().ToLowerInvariant());
+        return (features, RuntimeInformation.OSArchitecture.ToString().ToLowerInvariant());
     }
 
     public Task<List<ArchitectureInfo>> GetAvailableArchitecturesAsync()
@@ -333,6 +455,7 @@ public class ArchitectureDetector : IArchitectureDetector
             new() { Id = "x86-64-ssse3", Name = "x86-64 SSSE3", Description = "Intel Core 2+, some early x86-64", Category = "x86" },
             new() { Id = "x86-64-sse3-popcnt", Name = "x86-64 SSE3+POPCNT", Description = "Older x86-64 with SSE3 + POPCNT", Category = "x86" },
             new() { Id = "armv8", Name = "ARMv8", Description = "ARMv8 64-bit with popcnt and neon", Category = "ARM" },
+            new() { Id = "armv8-dotprod", Name = "ARMv8 DotProd", Description = "ARMv8.2+ with NEON dot product (Cortex-A76+, Snapdragon X)", Category = "ARM" },
             new() { Id = "apple-silicon", Name = "Apple Silicon", Description = "Apple M1/M2/M3", Category = "ARM" }
         ];
         return Task.FromResult(list);
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Diagnostics;
 using System.IO;
 using System.Linq;
@@ -30,6 +31,12 @@ public partial class BuildService(IStockfishDownloader downloader, ILogger<Build
     private bool _disposed;
 
     private const int MaxOutputCharacters = 500_000; // safety cap
+    private const long MemoryPerJobBytes = 700L * 1024 * 1024; // peak RSS of one optimized TU compile
+    private static readonly string CompilerCacheRoot = Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData), "StockfishCompiler", "cache", "compiler");
+    private const string CompilerCacheMaxSize = "2G"; // A handful of architectures' worth of objects
+
+    // Keyed by build PATH; like MSYS2Helper's make lookup, only hits are kept so a newly installed tool is still found
+    private static readonly ConcurrentDictionary<string, (string Name, string Path)> CompilerCacheLookup = new(StringComparer.OrdinalIgnoreCase);
 
     /// <summary>
     /// Executes a file operation and optionally fails the build when it cannot complete.
@@ -97,9 +104,13 @@ public partial class BuildService(IStockfishDownloader downloader, ILogger<Build
 
             var buildTarget = usePgo ? BuildTargets.ProfileBuild : BuildTargets.Build;
 
+            // Resolve make and the MSYS2 environment once; each make invocation gets its own copy to modify
+            var makeCmd = MSYS2Helper.FindMakeExecutable(configuration.SelectedCompiler?.Path);
+            var buildEnv = MSYS2Helper.SetupEnvironment(configuration);
+
             // Compile
             _outputSubject.OnNext($"Compiling Stockfish using '{buildTarget}' target...");
-            _activeBuildTask = CompileStockfishAsync(sourceDir, configuration, token, buildTarget);
+            _activeBuildTask = CompileStockfishAsync(sourceDir, configuration, makeCmd, new Dictionary<string, string>(buildEnv, StringComparer.OrdinalIgnoreCase), token, buildTarget);
             CompilationResult result;
             try
             {
@@ -111,11 +122,13 @@ public partial class BuildService(IStockfishDownloader downloader, ILogger<Build
             }
             _progressSubject.OnNext(90);
 
-            // Strip and copy
-            if (result.Success && configuration.StripExecutable)
+            // Plain builds strip at link time (-s). profile-build's sub-makes set their own EXTRALDFLAGS, which
+            // replaces ours, and Apple's linker ignores -s, so those binaries are stripped afterwards.
+            var stripAfterBuild = buildTarget == BuildTargets.ProfileBuild || RuntimeInformation.IsOSPlatform(OSPlatform.OSX);
+            if (result.Success && configuration.StripExecutable && stripAfterBuild)
             {
                 _outputSubject.OnNext("Stripping executable...");
-                await StripExecutableAsync(sourceDir, configuration, token);
+                await StripExecutableAsync(sourceDir, buildEnv, token);
             }
 
             if (result.Success)
@@ -156,13 +169,11 @@ public partial class BuildService(IStockfishDownloader downloader, ILogger<Build
         }
     }
 
-    private async Task<CompilationResult> CompileStockfishAsync(string sourcePath, BuildConfiguration config, CancellationToken token, string buildTarget = BuildTargets.ProfileBuild)
+    private async Task<CompilationResult> CompileStockfishAsync(string sourcePath, BuildConfiguration config, string? makeCmd, Dictionary<string, string> env, CancellationToken token, string buildTarget = BuildTargets.ProfileBuild)
     {
         var safeArch = SanitizeArchitecture(config.SelectedArchitecture?.Id);
-        var safeJobs = SanitizeParallelJobs(config.ParallelJobs);
+        var safeJobs = LimitJobsByMemory(SanitizeParallelJobs(config.ParallelJobs));
         var compType = GetCompType(config);
-        var makeCmd = MSYS2Helper.FindMakeExecutable(config.SelectedCompiler?.Path);
-        var env = MSYS2Helper.SetupEnvironment(config);
 
         // Create a sha256sum wrapper to bypass the validation issues on Windows
         string? wrapperDir = null;
@@ -228,7 +239,7 @@ if %errorlevel% == 0 (
             
             // Prepend our wrapper directory to PATH so it's found first
             var currentPath = env.GetValueOrDefault("PATH", Environment.GetEnvironmentVariable("PATH") ?? "");
-            env["PATH"] = $"{wrapperDir};{currentPath}";
+            env["PATH"] = string.Join(Path.PathSeparator, wrapperDir, currentPath);
             
             _outputSubject.OnNext("Created sha256sum wrapper to bypass validation issues (MSYS-friendly script + .bat fallback).");
         }
@@ -270,6 +281,14 @@ if %errorlevel% == 0 (
             // If we cannot manage the profile directory, let GCC fall back; build will still succeed without PGO gains
         }
 
+        // Wrap the compiler in sccache/ccache so repeat builds fetch objects from the cache
+        var compilerCache = config.UseCompilerCache ? DetectCompilerCache(env) : null;
+        if (compilerCache != null)
+        {
+            ConfigureCompilerCache(env, compilerCache, sourcePath);
+            _outputSubject.OnNext($"Using compiler cache: {compilerCache}");
+        }
+
         _outputSubject.OnNext($"Using make: {makeCmd}");
         _outputSubject.OnNext($"Config: Jobs={safeJobs}, Arch={safeArch}, Comp={compType}, Target={buildTarget}");
 
@@ -287,9 +306,19 @@ if %errorlevel% == 0 (
         };
 
         process.StartInfo.ArgumentList.Add($"-j{safeJobs}");
+        // MSYS2 make has no load average on Windows, so -l would be ignored there
+        if (!RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
+        {
+            process.StartInfo.ArgumentList.Add($"-l{OSHelper.GetPhysicalCoreCount()}");
+        }
         process.StartInfo.ArgumentList.Add(buildTarget);
         process.StartInfo.ArgumentList.Add($"ARCH={safeArch}");
         process.StartInfo.ArgumentList.Add($"COMP={compType}");
+        // Stockfish's Makefile lets COMPCXX override the CXX it derives from COMP
+        if (compilerCache != null)
+        {
+            process.StartInfo.ArgumentList.Add($"COMPCXX={compilerCache} {GetCompilerCommand(compType)}");
+        }
         // Force shasum/sha256sum detection to be blank so Makefile skips validation on Windows
         process.StartInfo.ArgumentList.Add("shasum_command=");
 
@@ -309,21 +338,106 @@ if %errorlevel% == 0 (
             // Ignore detection errors; make will handle downloads if needed
         }
 
+        var extraCxxFlags = new List<string>();
+        var extraLdFlags = new List<string>();
+        var extraProfileFlags = new List<string>();
+        var isProfileBuild = string.Equals(buildTarget, BuildTargets.ProfileBuild, StringComparison.OrdinalIgnoreCase);
+
         // Legacy Stockfish Makefiles (<=14) don't consume EXTRAPROFILEFLAGS for profile-use; silence missing .gcda noise.
         if (legacyProfileLayout)
         {
-            process.StartInfo.ArgumentList.Add("EXTRACXXFLAGS+=-Wno-missing-profile");
+            extraCxxFlags.Add("-Wno-missing-profile");
         }
 
         // Suppress noisy missing-profile warnings during profile-build; GCC will still fall back safely when data is absent.
-        if (string.Equals(buildTarget, BuildTargets.ProfileBuild, StringComparison.OrdinalIgnoreCase))
+        if (isProfileBuild)
+        {
+            extraProfileFlags.Add("-Wno-missing-profile");
+        }
+
+        // The binary is meant for this machine, so let the compiler tune for the exact microarchitecture.
+        // profile-build's sub-makes set EXTRACXXFLAGS themselves, so only EXTRAPROFILEFLAGS reaches them.
+        if (config.TargetsNativeCpu)
+        {
+            if (!isProfileBuild)
+            {
+                extraCxxFlags.Add("-march=native");
+                extraCxxFlags.Add("-mtune=native");
+            }
+            else if (!legacyProfileLayout)
+            {
+                extraProfileFlags.Add("-march=native");
+                extraProfileFlags.Add("-mtune=native");
+            }
+            else
+            {
+                _outputSubject.OnNext("Native CPU tuning is unavailable for PGO builds of Stockfish 14 and older; using the ARCH flags only.");
+            }
+        }
+
+        // Strip while linking rather than re-running make for its strip target. Only the plain build target
+        // keeps our EXTRALDFLAGS; BuildAsync strips profile builds afterwards.
+        if (config.StripExecutable && buildTarget == BuildTargets.Build && !RuntimeInformation.IsOSPlatform(OSPlatform.OSX))
+        {
+            extraLdFlags.Add("-s");
+        }
+
+        if (extraCxxFlags.Count > 0)
+        {
+            process.StartInfo.ArgumentList.Add($"EXTRACXXFLAGS={string.Join(' ', extraCxxFlags)}");
+        }
+        if (extraLdFlags.Count > 0)
+        {
+            process.StartInfo.ArgumentList.Add($"EXTRALDFLAGS={string.Join(' ', extraLdFlags)}");
+        }
+        if (extraProfileFlags.Count > 0)
         {
-            process.StartInfo.ArgumentList.Add("EXTRAPROFILEFLAGS=-Wno-missing-profile");
+            process.StartInfo.ArgumentList.Add($"EXTRAPROFILEFLAGS={string.Join(' ', extraProfileFlags)}");
         }
+        if (extraCxxFlags.Count > 0 || extraLdFlags.Count > 0 || extraProfileFlags.Count > 0)
+        {
+            _outputSubject.OnNext($"Extra flags: CXX=[{string.Join(' ', extraCxxFlags)}] LD=[{string.Join(' ', extraLdFlags)}] PROFILE=[{string.Join(' ', extraProfileFlags)}]");
+        }
+
+        MSYS2Helper.ApplyEnvironment(process.StartInfo, env);
+
+        var outputBuilder = new StringBuilder();
+        try
+        {
+            var exitCode = await RunStreamingAsync(process, outputBuilder, token);
 
-        foreach (var kvp in env)
-            process.StartInfo.EnvironmentVariables[kvp.Key] = kvp.Value;
+            var output = outputBuilder.ToString();
+            
+            // Log the result for debugging
+            if (exitCode != 0)
+            {
+                _logger.LogError("Build failed with exit code {ExitCode}. Last output lines:\n{Output}", 
+                    exitCode, 
+                    GetLastLines(output, 50));
+            }
 
+            return new CompilationResult
+            {
+                Success = exitCode == 0,
+                Output = output,
+                ExitCode = exitCode
+            };
+        }
+        finally
+        {
+            // Clean up profile data even on failure/cancel to avoid cluttering %TEMP%; the two directories are unrelated
+            await Task.WhenAll(
+                CleanupTempDirectoryWithRetryAsync(profileDir, "profile data directory"),
+                CleanupTempDirectoryWithRetryAsync(wrapperDir, "sha256sum wrapper directory"));
+        }
+    }
+
+    /// <summary>
+    /// Starts a make/strip process (configured with redirected stdout/stderr) and streams stdout and stderr through AppendOutput as lines arrive,
+    /// so long builds show progress immediately and nothing is buffered until exit. Cancelling kills the process.
+    /// </summary>
+    private async Task<int> RunStreamingAsync(Process process, StringBuilder outputBuilder, CancellationToken token)
+    {
         process.Start();
 
         using var registration = token.Register(() =>
@@ -363,49 +477,27 @@ if %errorlevel% == 0 (
             }
         });
 
-        var outputBuilder = new StringBuilder();
-        static Task ReadAsync(StreamReader reader, StringBuilder outputBuilder, Action<StringBuilder, string> appendOutput, CancellationToken token) => Task.Run(async () =>
-        {
-            while (!reader.EndOfStream)
-            {
-                token.ThrowIfCancellationRequested();
-                var line = await reader.ReadLineAsync();
-                if (line == null) break;
-                appendOutput(outputBuilder, line);
-            }
-        }, token);
-
-        var readStdOut = ReadAsync(process.StandardOutput, outputBuilder, AppendOutput, token);
-        var readStdErr = ReadAsync(process.StandardError, outputBuilder, AppendOutput, token);
-        var waitExit = process.WaitForExitAsync(token);
-
-        try
+        async Task ReadAsync(StreamReader source)
         {
-            await Task.WhenAll(readStdOut, readStdErr, waitExit);
-
-            var output = outputBuilder.ToString();
-            
-            // Log the result for debugging
-            if (process.ExitCode != 0)
+            // Re-wrap the pipe with a 64 KiB buffer; -j builds emit far more than the default 4 KiB reader handles per syscall
+            using var reader = new StreamReader(source.BaseStream, source.CurrentEncoding, detectEncodingFromByteOrderMarks: false, bufferSize: 64 * 1024);
+            string? line;
+            while ((line = await reader.ReadLineAsync(token)) != null)
             {
-                _logger.LogError("Build failed with exit code {ExitCode}. Last output lines:\n{Output}", 
-                    process.ExitCode, 
-                    GetLastLines(output, 50));
+                // stdout and stderr readers share the builder
+                lock (outputBuilder)
+                {
+                    AppendOutput(outputBuilder, line);
+                }
             }
-
-            return new CompilationResult
-            {
-                Success = process.ExitCode == 0,
-                Output = output,
-                ExitCode = process.ExitCode
-            };
-        }
-        finally
-        {
-            // Clean up profile data even on failure/cancel to avoid cluttering %TEMP%
-            await CleanupTempDirectoryWithRetryAsync(profileDir, "profile data directory");
-            await CleanupTempDirectoryWithRetryAsync(wrapperDir, "sha256sum wrapper directory");
         }
+
+        // Read on the thread pool: BuildAsync is awaited from the dispatcher, and every line would otherwise be handled there
+        await Task.WhenAll(
+            Task.Run(() => ReadAsync(process.StandardOutput), token),
+            Task.Run(() => ReadAsync(process.StandardError), token),
+            process.WaitForExitAsync(token));
+        return process.ExitCode;
     }
 
     private void AppendOutput(StringBuilder builder, string line)
@@ -473,29 +565,30 @@ if %errorlevel% == 0 (
         _outputSubject.OnNext(line);
     }
 
-    private async Task StripExecutableAsync(string sourcePath, BuildConfiguration config, CancellationToken token)
+    private async Task StripExecutableAsync(string sourcePath, IReadOnlyDictionary<string, string> env, CancellationToken token)
     {
-        var makeCmd = MSYS2Helper.FindMakeExecutable(config.SelectedCompiler?.Path);
-        var env = MSYS2Helper.SetupEnvironment(config);
-
         using var process = new Process
         {
             StartInfo = new ProcessStartInfo
             {
-                FileName = makeCmd,
+                FileName = "strip",
                 WorkingDirectory = sourcePath,
-                RedirectStandardOutput = false,
-                RedirectStandardError = false,
+                RedirectStandardOutput = true,
+                RedirectStandardError = true,
                 UseShellExecute = false,
                 CreateNoWindow = true
             }
         };
-        process.StartInfo.ArgumentList.Add("strip");
-        process.StartInfo.ArgumentList.Add($"COMP={GetCompType(config)}");
-        foreach (var kvp in env)
-            process.StartInfo.EnvironmentVariables[kvp.Key] = kvp.Value;
-        process.Start();
-        await process.WaitForExitAsync(token);
+        // MinGW's strip doesn't add the .exe suffix itself
+        process.StartInfo.ArgumentList.Add(RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? "stockfish.exe" : "stockfish");
+        MSYS2Helper.ApplyEnvironment(process.StartInfo, env);
+
+        var exitCode = await RunStreamingAsync(process, new StringBuilder(), token);
+        if (exitCode != 0)
+        {
+            _logger.LogWarning("strip exited with code {ExitCode}", exitCode);
+            _outputSubject.OnNext($"Warning: strip failed with exit code {exitCode}; keeping the unstripped executable.");
+        }
     }
 
     private void CopyExecutable(string sourcePath, BuildConfiguration config)
@@ -512,7 +605,8 @@ if %errorlevel% == 0 (
         var outputPath = ValidateOutputPath(config.OutputDirectory, outputNameRaw);
         try
         {
-            File.Copy(sourceExe, outputPath, true);
+            // The temp tree is deleted after the build, so the binary can be moved rather than duplicated
+            FileSystemHelper.MoveOrCopyFile(sourceExe, outputPath);
             _outputSubject.OnNext($"Executable saved to: {outputPath}");
         }
         catch (Exception ex)
@@ -530,6 +624,70 @@ if %errorlevel% == 0 (
             : config.SelectedCompiler.Type;
     }
 
+    private static string GetCompilerCommand(string compType) =>
+        compType == CompilerType.Clang ? "clang++" : "g++";
+
+    /// <summary>
+    /// Looks for sccache (preferred) or ccache on the build PATH.
+    /// </summary>
+    private static string? DetectCompilerCache(Dictionary<string, string> env)
+    {
+        var searchPath = env.GetValueOrDefault("PATH", string.Empty);
+        if (CompilerCacheLookup.TryGetValue(searchPath, out var cached) && File.Exists(cached.Path))
+            return cached.Name;
+
+        foreach (var candidate in new[] { "sccache", "ccache" })
+        {
+            if (FindOnPath(candidate, searchPath) is { } path)
+            {
+                CompilerCacheLookup[searchPath] = (candidate, path);
+                return candidate;
+            }
+        }
+        return null;
+    }
+
+    private static string? FindOnPath(string command, string searchPath)
+    {
+        var fileName = RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? command + ".exe" : command;
+        foreach (var dir in searchPath.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+        {
+            try
+            {
+                var candidate = Path.Combine(dir.Trim('"'), fileName);
+                if (File.Exists(candidate))
+                    return candidate;
+            }
+            catch (ArgumentException)
+            {
+                // Ignore malformed PATH entries
+            }
+        }
+        return null;
+    }
+
+    private static void ConfigureCompilerCache(Dictionary<string, string> env, string compilerCache, string sourcePath)
+    {
+        // Keep the cache outside the per-build temp directory so it survives cleanup; respect user overrides
+        if (compilerCache == "sccache")
+        {
+            if (!env.ContainsKey("SCCACHE_DIR"))
+                env["SCCACHE_DIR"] = Path.Combine(CompilerCacheRoot, "sccache");
+            if (!env.ContainsKey("SCCACHE_CACHE_SIZE"))
+                env["SCCACHE_CACHE_SIZE"] = CompilerCacheMaxSize;
+        }
+        else
+        {
+            if (!env.ContainsKey("CCACHE_DIR"))
+                env["CCACHE_DIR"] = Path.Combine(CompilerCacheRoot, "ccache");
+            if (!env.ContainsKey("CCACHE_MAXSIZE"))
+                env["CCACHE_MAXSIZE"] = CompilerCacheMaxSize;
+            // Each build extracts to a fresh temp directory; hash relative paths so hits carry across builds
+            env["CCACHE_BASEDIR"] = sourcePath;
+            env["CCACHE_NOHASHDIR"] = "true";
+        }
+    }
+
     private static (bool Success, string Message) VerifyNetworkFilesForPGO(string sourceDirectory)
     {
         var nnueFiles = Directory.GetFiles(sourceDirectory, "*.nnue");
@@ -564,7 +722,7 @@ if %errorlevel% == 0 (
         {
             try
             {
-                Directory.Delete(tempDirectory, true);
+                await Task.Run(() => FileSystemHelper.DeleteDirectory(tempDirectory));
                 _outputSubject.OnNext($"Cleaned up {description}.");
                 return;
             }
@@ -594,6 +752,21 @@ if %errorlevel% == 0 (
         return jobs;
     }
 
+    private int LimitJobsByMemory(int jobs)
+    {
+        var available = OSHelper.GetAvailableMemoryBytes();
+        if (available == null)
+            return jobs;
+
+        var limit = (int)Math.Max(1, available.Value / MemoryPerJobBytes);
+        if (jobs <= limit)
+            return jobs;
+
+        _outputSubject.OnNext($"Limiting parallel jobs to {limit} ({available.Value / 1024 / 1024} MB of memory available)");
+        _logger.LogInformation("Reduced parallel jobs from {Requested} to {Limit} due to available memory", jobs, limit);
+        return limit;
+    }
+
     private static string GetLastLines(string text, int lineCount)
     {
         if (string.IsNullOrEmpty(text))
@@ -620,6 +793,7 @@ if %errorlevel% == 0 (
             Architectures.X86_64_SSSE3,
             Architectures.X86_64_SSE3_POPCNT,
             Architectures.ARMV8,
+            Architectures.ARMV8_DOTPROD,
             Architectures.APPLE_SILICON
         };
         
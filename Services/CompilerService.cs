@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Diagnostics;
 using System.Runtime.InteropServices;
 using System.IO;
@@ -10,19 +11,32 @@ namespace StockfishCompiler.Services;
 public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
 {
     private static readonly string[] PathCandidates = ["g++", "clang++", "gcc", "clang"];
+    private static readonly string[] MSYS2Environments = ["mingw64", "mingw32", "ucrt64", "clang64", "clang32", "clangarm64"];
+
+    // Caps concurrent --version probes so parallel detection doesn't fork-bomb slow machines
+    private readonly SemaphoreSlim _probeThrottle = new(8);
+
+    // gcc and clang often share a bin directory; check its runtime DLLs once per detection run
+    private readonly ConcurrentDictionary<string, List<string>> _missingDllCache = new(StringComparer.OrdinalIgnoreCase);
 
     public async Task<List<CompilerInfo>> DetectCompilersAsync()
     {
         logger.LogInformation("Starting comprehensive compiler detection");
         List<CompilerInfo> compilers = [];
+        _missingDllCache.Clear();
 
         if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
         {
-            compilers.AddRange(await DetectMSYS2CompilersAsync());
-            compilers.AddRange(await DetectGitForWindowsCompilersAsync());
-            compilers.AddRange(await DetectVisualStudioCompilersAsync());
-            compilers.AddRange(await DetectMinGWStandaloneAsync());
-            compilers.AddRange(await DetectPathCompilersAsync());
+            // Run the independent searches concurrently; results keep their priority order
+            var groups = await Task.WhenAll(
+                Task.Run(DetectMSYS2CompilersAsync),
+                Task.Run(DetectGitForWindowsCompilersAsync),
+                Task.Run(DetectVisualStudioCompilersAsync),
+                Task.Run(DetectMinGWStandaloneAsync),
+                Task.Run(DetectPathCompilersAsync));
+
+            foreach (var group in groups)
+                compilers.AddRange(group);
         }
         else
         {
@@ -71,6 +85,30 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
         return success;
     }
 
+    public async Task<CompilerInfo> RevalidateCompilerAsync(CompilerInfo compiler)
+    {
+        var fullPath = Path.Combine(compiler.Path, compiler.Name);
+
+        if (compiler.Type == "msvc")
+        {
+            // cl.exe has no --version; it prints its banner when run without arguments
+            var exists = File.Exists(fullPath);
+            return new CompilerInfo
+            {
+                Name = compiler.Name,
+                Type = compiler.Type,
+                Version = exists ? await GetMSVCVersionAsync(fullPath) : "(unavailable)",
+                Path = compiler.Path,
+                DisplayName = compiler.DisplayName,
+                IsAvailable = exists
+            };
+        }
+
+        var refreshed = await CreateCompilerInfoAsync(fullPath, compiler.Type);
+        refreshed.DisplayName = compiler.DisplayName; // Detection may have given it a more specific name
+        return refreshed;
+    }
+
     public async Task<string> GetCompilerVersionAsync(string compilerPath)
     {
         var (_, version, _) = await TryRunCompilerAsync(compilerPath, Path.GetDirectoryName(compilerPath));
@@ -85,7 +123,7 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
         // First, check for critical DLLs that GCC/MinGW compilers need
         if (!string.IsNullOrEmpty(binDirectory) && RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
         {
-            var missingDlls = CheckForRequiredDlls(binDirectory);
+            var missingDlls = _missingDllCache.GetOrAdd(binDirectory, CheckForRequiredDlls);
             if (missingDlls.Count > 0)
             {
                 var errorMsg = $"Missing required DLLs: {string.Join(", ", missingDlls)}";
@@ -94,6 +132,7 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
             }
         }
         
+        await _probeThrottle.WaitAsync();
         try
         {
             var psi = new ProcessStartInfo
@@ -118,7 +157,9 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
                 return (false, string.Empty, "Failed to start process");
 
             using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
-            var outputTask = process.StandardOutput.ReadToEndAsync();
+            // Only the first stdout line carries the version; drain the rest as raw bytes without decoding.
+            // stderr is still read in full because that's where missing-DLL loader errors show up.
+            var firstLineTask = ReadFirstLineAsync(process.StandardOutput);
             var errorTask = process.StandardError.ReadToEndAsync();
 
             try
@@ -132,7 +173,7 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
                 return (false, "Timed out", "Process timed out");
             }
 
-            var output = await outputTask;
+            var firstLine = (await firstLineTask)?.Trim() ?? string.Empty;
             var errorOutput = await errorTask;
             
             // Check for common DLL-related errors in stderr
@@ -155,7 +196,7 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
             if (process.ExitCode != 0)
             {
                 // Some compilers return non-zero for --version but still work; check if we got version output
-                if (string.IsNullOrWhiteSpace(output))
+                if (string.IsNullOrWhiteSpace(firstLine))
                 {
                     var errorMsg = string.IsNullOrWhiteSpace(errorOutput) 
                         ? $"Exit code {process.ExitCode}" 
@@ -166,8 +207,6 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
                 }
             }
 
-            var firstLine = output.Split('\n').FirstOrDefault()?.Trim() ?? string.Empty;
-            
             // Sanity check - version output should contain something recognizable
             if (string.IsNullOrWhiteSpace(firstLine))
             {
@@ -205,8 +244,19 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
             logger.LogDebug(ex, "Failed to run compiler at {Path}", compilerPath);
             return (false, string.Empty, ex.Message);
         }
+        finally
+        {
+            _probeThrottle.Release();
+        }
     }
     
+    private static async Task<string?> ReadFirstLineAsync(StreamReader reader)
+    {
+        var line = await reader.ReadLineAsync();
+        await reader.BaseStream.CopyToAsync(Stream.Null);
+        return line;
+    }
+
     /// <summary>
     /// Checks for the presence of critical DLLs required by GCC/MinGW compilers.
     /// </summary>
@@ -308,24 +358,30 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
                         .ToList();
         });
 
-        List<CompilerInfo> compilers = [];
+        var candidates = new List<(string Exe, string Type, string DisplayName)>();
         
         foreach (var basePath in possiblePaths)
         {
             logger.LogInformation("Found MSYS2 candidate: {Path}", basePath);
-            
-            var msysPaths = new[]
+
+            // One directory listing per installation instead of probing each environment separately
+            HashSet<string> present;
+            try
             {
-                Path.Combine(basePath, "mingw64", "bin"),
-                Path.Combine(basePath, "mingw32", "bin"),
-                Path.Combine(basePath, "ucrt64", "bin"),
-                Path.Combine(basePath, "clang64", "bin"),
-                Path.Combine(basePath, "clang32", "bin"),
-                Path.Combine(basePath, "clangarm64", "bin")
-            };
+                present = Directory.EnumerateDirectories(basePath)
+                    .Select(Path.GetFileName)
+                    .OfType<string>()
+                    .ToHashSet(StringComparer.OrdinalIgnoreCase);
+            }
+            catch (Exception ex)
+            {
+                logger.LogDebug(ex, "Could not enumerate MSYS2 path: {Path}", basePath);
+                continue;
+            }
 
-            foreach (var path in msysPaths.Where(Directory.Exists))
+            foreach (var environment in MSYS2Environments.Where(present.Contains))
             {
+                var path = Path.Combine(basePath, environment, "bin");
                 logger.LogDebug("Checking MSYS2 path: {Path}", path);
                 
                 var gcc = Path.Combine(path, "g++.exe");
@@ -334,21 +390,25 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
                 if (File.Exists(gcc))
                 {
                     logger.LogInformation("Found g++ at: {Path}", gcc);
-                    var compilerInfo = await CreateCompilerInfoAsync(gcc, "gcc");
-                    compilerInfo.DisplayName = $"MSYS2 GCC - {Path.GetFileName(Path.GetDirectoryName(path))} ({basePath})";
-                    compilers.Add(compilerInfo);
+                    candidates.Add((gcc, "gcc", $"MSYS2 GCC - {environment} ({basePath})"));
                 }
                 if (File.Exists(clang))
                 {
                     logger.LogInformation("Found clang++ at: {Path}", clang);
-                    var compilerInfo = await CreateCompilerInfoAsync(clang, "clang");
-                    compilerInfo.DisplayName = $"MSYS2 Clang - {Path.GetFileName(Path.GetDirectoryName(path))} ({basePath})";
-                    compilers.Add(compilerInfo);
+                    candidates.Add((clang, "clang", $"MSYS2 Clang - {environment} ({basePath})"));
                 }
             }
         }
 
-        return compilers;
+        // Probe all candidates concurrently; WhenAll preserves the discovery order
+        var compilers = await Task.WhenAll(candidates.Select(async candidate =>
+        {
+            var compilerInfo = await CreateCompilerInfoAsync(candidate.Exe, candidate.Type);
+            compilerInfo.DisplayName = candidate.DisplayName;
+            return compilerInfo;
+        }));
+
+        return [.. compilers];
     }
 
     private async Task<List<CompilerInfo>> DetectGitForWindowsCompilersAsync()
@@ -531,10 +591,10 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
     {
         logger.LogInformation("Searching for compilers in PATH");
         List<CompilerInfo> compilers = [];
+        var resolved = await Task.WhenAll(PathCandidates.Select(WhichAsync));
 
-        foreach (var c in PathCandidates)
+        foreach (var (c, path) in PathCandidates.Zip(resolved))
         {
-            var path = await WhichAsync(c);
             if (!string.IsNullOrEmpty(path))
             {
                 logger.LogInformation("Found {Command} in PATH: {Path}", c, path);
@@ -551,10 +611,10 @@ public class CompilerService(ILogger<CompilerService> logger) : ICompilerService
     {
         logger.LogInformation("Searching for Unix compilers");
         List<CompilerInfo> compilers = [];
+        var resolved = await Task.WhenAll(PathCandidates.Select(WhichAsync));
         
-        foreach (var c in PathCandidates)
+        foreach (var (c, path) in PathCandidates.Zip(resolved))
         {
-            var path = await WhichAsync(c);
             if (!string.IsNullOrEmpty(path))
             {
                 logger.LogInformation("Found {Command}: {Path}", c, path);
@@ -24,6 +24,13 @@ public interface ICompilerService
     /// <param name="compiler">The compiler information to validate</param>
     /// <returns>True if the compiler is valid and accessible, false otherwise</returns>
     Task<bool> ValidateCompilerAsync(CompilerInfo compiler);
+
+    /// <summary>
+    /// Re-runs the version and DLL checks on a previously detected compiler
+    /// </summary>
+    /// <param name="compiler">The compiler information to re-check, e.g. one restored from settings</param>
+    /// <returns>A copy of the compiler with refreshed version and validation fields</returns>
+    Task<CompilerInfo> RevalidateCompilerAsync(CompilerInfo compiler);
     
     /// <summary>
     /// Gets the version information of a compiler
@@ -1,8 +1,8 @@
 using System.IO;
-using System.Security.Cryptography;
 using System.Text;
 using System.Text.RegularExpressions;
 using Microsoft.Extensions.Logging;
+using StockfishCompiler.Helpers;
 
 namespace StockfishCompiler.Services;
 
@@ -198,10 +198,7 @@ public class NetworkValidationManager
             }
 
             // Compute SHA256
-            using var sha256 = SHA256.Create();
-            await using var stream = File.OpenRead(filePath);
-            var hashBytes = await sha256.ComputeHashAsync(stream, cancellationToken);
-            validation.Sha256Hash = Convert.ToHexString(hashBytes).ToLowerInvariant();
+            validation.Sha256Hash = await FileSystemHelper.ComputeSha256Async(filePath, cancellationToken);
 
             // Verify hash matches filename pattern
             var match = NetworkFileNameRegex.Match(validation.FileName);
@@ -217,9 +214,11 @@ public class NetworkValidationManager
             }
 
             // Check file header (NNUE files start with specific magic bytes)
-            stream.Seek(0, SeekOrigin.Begin);
             var header = new byte[4];
-            await stream.ReadAsync(header, cancellationToken);
+            await using (var stream = File.OpenRead(filePath))
+            {
+                await stream.ReadAsync(header, cancellationToken);
+            }
             
             // NNUE files should start with 0x4E4E5545 ("NNUE" in ASCII)
             if (header[0] != 0x4E || header[1] != 0x4E || header[2] != 0x55 || header[3] != 0x45)
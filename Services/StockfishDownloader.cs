@@ -1,11 +1,14 @@
 using System.IO;
 using System.IO.Compression;
+using System.Net;
 using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Runtime.CompilerServices;
 using System.Runtime.InteropServices;
-using System.Security.Cryptography;
 using System.Security;
 using System.Text.Json;
 using System.Text.RegularExpressions;
+using Microsoft.Win32.SafeHandles;
 using StockfishCompiler.Helpers;
 using StockfishCompiler.Models;
 
@@ -18,6 +21,8 @@ public partial class StockfishDownloader : IStockfishDownloader
     private const string GitHubReleasesApiUrl = "https://api.github.com/repos/official-stockfish/Stockfish/releases";
     private const string MasterZipUrl = "https://github.com/official-stockfish/Stockfish/archive/refs/heads/master.zip";
     private static readonly string CacheRoot = Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData), "StockfishCompiler", "cache", "sources");
+    // Network names embed their SHA-256 prefix, so a cached file is checked against its own name rather than a manifest
+    private static readonly string NetworkCacheRoot = Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData), "StockfishCompiler", "cache", "networks");
     private static readonly string[] NetworkMirrors =
     [
         "https://tests.stockfishchess.org/api/nn/{0}",
@@ -37,10 +42,57 @@ public partial class StockfishDownloader : IStockfishDownloader
     [GeneratedRegex(@"nn-([a-f0-9]{12})\.nnue", RegexOptions.IgnoreCase, matchTimeoutMilliseconds: 1000)]
     private static partial Regex NetworkFileNameRegex();
     private const long MaxDownloadSize = 500L * 1024 * 1024; // 500 MB safety cap
+    private const int MinEntriesForParallelExtract = 64;
+    private const int ExtractBufferSize = 64 * 1024;
+    private const int MaxDownloadAttempts = 3;
+    private const int DownloadBufferSize = 1024 * 1024; // 1 MiB: a ~70 MB network is ~70 writes instead of ~9000
+    private const long MinSizeForSegmentedDownload = 16L * 1024 * 1024;
+    private const int DownloadSegments = 4; // Both networks may download at once; the pooled handler allows 8 connections per server
+    private static readonly TimeSpan LatestReleaseLifetime = TimeSpan.FromMinutes(30);
+    private static readonly object LatestReleaseLock = new();
+    private static Task<ReleaseInfo?>? _latestReleaseFetch;
+    private static DateTime _latestReleaseFetchedAt;
 
     [GeneratedRegex(@"sf_(\d+(?:\.\d+)?)", RegexOptions.IgnoreCase)]
     private static partial Regex VersionTagRegex();
 
+    // Whole-string form of VersionTagRegex for user-supplied tags, which end up in a URL and a cache file name
+    [GeneratedRegex(@"^sf_(\d+(?:\.\d+)?)\z", RegexOptions.IgnoreCase)]
+    private static partial Regex ExactVersionTagRegex();
+
+    /// <summary>
+    /// True for "master", "stable", "latest" or a release tag such as "sf_17.1".
+    /// </summary>
+    public static bool IsValidSourceVersion(string? version)
+    {
+        if (string.IsNullOrWhiteSpace(version))
+            return false;
+
+        return version is "master" or "stable" or "latest"
+            || ExactVersionTagRegex().IsMatch(version);
+    }
+
+    /// <summary>
+    /// Builds the version entry for a release tag that isn't in the fetched releases list.
+    /// </summary>
+    public static bool TryCreateVersionInfo(string? tagName, out StockfishVersionInfo versionInfo)
+    {
+        versionInfo = null!;
+        if (string.IsNullOrWhiteSpace(tagName))
+            return false;
+
+        var versionMatch = ExactVersionTagRegex().Match(tagName);
+        if (!versionMatch.Success)
+            return false;
+
+        var versionNumber = versionMatch.Groups[1].Value;
+        if (!int.TryParse(versionNumber.Split('.')[0], out var majorVersion))
+            return false;
+
+        versionInfo = ClassifyStockfishVersion(majorVersion, versionNumber, tagName, null, null);
+        return true;
+    }
+
     public StockfishDownloader(HttpClient httpClient)
     {
         _httpClient = httpClient;
@@ -238,13 +290,41 @@ public partial class StockfishDownloader : IStockfishDownloader
     }
 
     public async Task<ReleaseInfo?> GetLatestReleaseAsync(CancellationToken cancellationToken = default)
+    {
+        // Shared across instances (the typed client is transient) so a prefetch from the UI serves the build
+        Task<ReleaseInfo?> fetch;
+        lock (LatestReleaseLock)
+        {
+            if (_latestReleaseFetch == null || DateTime.UtcNow - _latestReleaseFetchedAt > LatestReleaseLifetime)
+            {
+                _latestReleaseFetch = FetchLatestReleaseAsync();
+                _latestReleaseFetchedAt = DateTime.UtcNow;
+            }
+            fetch = _latestReleaseFetch;
+        }
+
+        var release = await fetch.WaitAsync(cancellationToken);
+        if (release == null)
+        {
+            // Don't keep serving a failed lookup
+            lock (LatestReleaseLock)
+            {
+                if (_latestReleaseFetch == fetch)
+                    _latestReleaseFetch = null;
+            }
+        }
+
+        return release;
+    }
+
+    private async Task<ReleaseInfo?> FetchLatestReleaseAsync()
     {
         try
         {
-            using var response = await _httpClient.GetAsync(GitHubApiUrl, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            using var response = await _httpClient.GetAsync(GitHubApiUrl, HttpCompletionOption.ResponseHeadersRead);
             response.EnsureSuccessStatusCode();
-            using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
-            using var doc = await JsonDocument.ParseAsync(stream, cancellationToken: cancellationToken);
+            using var stream = await response.Content.ReadAsStreamAsync();
+            using var doc = await JsonDocument.ParseAsync(stream);
             var root = doc.RootElement;
             return new ReleaseInfo
             {
@@ -261,6 +341,9 @@ public partial class StockfishDownloader : IStockfishDownloader
 
     public async Task<SourceDownloadResult> DownloadSourceAsync(string version, IProgress<string>? progress = null, CancellationToken cancellationToken = default)
     {
+        if (!IsValidSourceVersion(version))
+            throw new ArgumentException($"Invalid Stockfish version: {version}", nameof(version));
+
         progress?.Report($"Downloading Stockfish {version}...");
 
         var tempDir = Path.Combine(Path.GetTempPath(), $"stockfish_build_{Guid.NewGuid():N}");
@@ -286,24 +369,37 @@ public partial class StockfishDownloader : IStockfishDownloader
             url = $"https://github.com/official-stockfish/Stockfish/archive/refs/tags/{version}.zip";
         }
 
-        // Prefer cached source if present; otherwise download and store in cache for offline reuse.
+        // Prefer cached source if present; otherwise download straight into the cache for offline reuse.
+        // The archive is extracted from wherever it lives, so it is never copied into the temp directory.
         if (File.Exists(cachePath) && new FileInfo(cachePath).Length > 0)
         {
             progress?.Report("Using cached source archive.");
-            File.Copy(cachePath, zipPath, overwrite: true);
+            zipPath = cachePath;
         }
         else
         {
-            await SafeDownloadToFileAsync(url, zipPath, progress, cancellationToken);
+            var cached = false;
             try
             {
                 Directory.CreateDirectory(CacheRoot);
-                File.Copy(zipPath, cachePath, overwrite: true);
-                progress?.Report($"Cached source at: {cachePath}");
+                cached = true;
             }
             catch
             {
-                // Cache write is best-effort; ignore failures.
+                // Cache write is best-effort; fall back to downloading into the temp directory.
+            }
+
+            if (cached)
+            {
+                var partialPath = cachePath + ".part";
+                await SafeDownloadToFileAsync(url, partialPath, progress, cancellationToken);
+                File.Move(partialPath, cachePath, overwrite: true);
+                zipPath = cachePath;
+                progress?.Report($"Cached source at: {cachePath}");
+            }
+            else
+            {
+                await SafeDownloadToFileAsync(url, zipPath, progress, cancellationToken);
             }
         }
 
@@ -356,76 +452,292 @@ public partial class StockfishDownloader : IStockfishDownloader
             return false;
         }
 
-        var overallSuccess = true;
+        // The big and small networks come from the same mirrors but are independent, so fetch them concurrently
+        var results = await Task.WhenAll(networkFiles.Select(networkFile =>
+            DownloadNetworkFileAsync(sourceDirectory, networkFile, progress, cancellationToken)));
+
+        return results.All(success => success);
+    }
+
+    private async Task<bool> DownloadNetworkFileAsync(string sourceDirectory, string networkFile, IProgress<string>? progress, CancellationToken cancellationToken)
+    {
+        var destination = Path.Combine(sourceDirectory, networkFile);
+        if (File.Exists(destination))
+        {
+            if (await ValidateNetworkFileAsync(destination, networkFile, cancellationToken))
+            {
+                progress?.Report($"{networkFile} already present and validated.");
+                return true;
+            }
+
+            progress?.Report($"{networkFile} exists but failed validation - re-downloading.");
+        }
+
+        var cachedNetwork = Path.Combine(NetworkCacheRoot, networkFile);
+        if (await ValidateNetworkFileAsync(cachedNetwork, networkFile, cancellationToken))
+        {
+            // A ~70 MB copy; keep it off the caller's (UI) thread
+            await Task.Run(() => FileSystemHelper.CopyFile(cachedNetwork, destination), cancellationToken);
+            progress?.Report($"Using cached {networkFile}.");
+            return true;
+        }
 
-        foreach (var networkFile in networkFiles)
+        foreach (var urlTemplate in NetworkMirrors)
         {
-            var destination = Path.Combine(sourceDirectory, networkFile);
-            if (File.Exists(destination))
+            var url = string.Format(urlTemplate, networkFile);
+            try
             {
-                if (await ValidateNetworkFileAsync(destination, networkFile, cancellationToken))
+                progress?.Report($"Downloading {networkFile} from {url}...");
+                
+                var tempNetPath = destination + ".tmp";
+                if (!await TryDownloadInSegmentsAsync(url, tempNetPath, progress, cancellationToken))
+                    await SafeDownloadToFileAsync(url, tempNetPath, progress, cancellationToken);
+
+                if (!await ValidateNetworkFileAsync(tempNetPath, networkFile, cancellationToken))
                 {
-                    progress?.Report($"{networkFile} already present and validated.");
+                    progress?.Report($"Downloaded {networkFile} from {url} failed validation.");
+                    File.Delete(tempNetPath);
                     continue;
                 }
 
-                progress?.Report($"{networkFile} exists but failed validation - re-downloading.");
+                var sizeMb = new FileInfo(tempNetPath).Length / 1024d / 1024d;
+                File.Move(tempNetPath, destination, true);
+                progress?.Report($"Saved {networkFile} ({sizeMb:F1} MB).");
+                await Task.Run(() => CacheNetworkFile(destination, cachedNetwork));
+                return true;
+            }
+            catch (Exception ex)
+            {
+                progress?.Report($"Failed to download {networkFile} from {url} ({ex.Message}).");
             }
+        }
+
+        progress?.Report($"Unable to download {networkFile} - make will retry during build.");
+        return false;
+    }
+
+    private static void CacheNetworkFile(string networkPath, string cachePath)
+    {
+        try
+        {
+            Directory.CreateDirectory(NetworkCacheRoot);
+            var partialPath = cachePath + ".part";
+            FileSystemHelper.CopyFile(networkPath, partialPath);
+            File.Move(partialPath, cachePath, overwrite: true);
+        }
+        catch
+        {
+            // Cache write is best-effort; the next build just downloads the network again.
+        }
+    }
 
-            var downloaded = false;
-            foreach (var urlTemplate in NetworkMirrors)
+    /// <summary>
+    /// Fetches a large file as several parallel Range requests, each on its own connection, which fills a
+    /// high-latency link better than one TCP stream. Returns false (with nothing left behind) when the server
+    /// doesn't advertise byte ranges, the file is small, or a segment fails; the caller then downloads normally.
+    /// </summary>
+    private async Task<bool> TryDownloadInSegmentsAsync(string url, string destinationPath, IProgress<string>? progress, CancellationToken cancellationToken)
+    {
+        long totalBytes;
+        Uri resolvedUri;
+        EntityTagHeaderValue? etag;
+        try
+        {
+            using var head = new HttpRequestMessage(HttpMethod.Head, url);
+            RequestIdentityEncoding(head);
+            using var response = await _httpClient.SendAsync(head, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            if (!response.IsSuccessStatusCode
+                || !response.Headers.AcceptRanges.Contains("bytes")
+                || response.Content.Headers.ContentLength is not { } length
+                || length < MinSizeForSegmentedDownload
+                || length > MaxDownloadSize)
             {
-                var url = string.Format(urlTemplate, networkFile);
-                try
-                {
-                    progress?.Report($"Downloading {networkFile} from {url}...");
-                    
-                    var tempNetPath = destination + ".tmp";
-                    await SafeDownloadToFileAsync(url, tempNetPath, progress, cancellationToken);
+                return false;
+            }
 
-                    if (!await ValidateNetworkFileAsync(tempNetPath, networkFile, cancellationToken))
-                    {
-                        progress?.Report($"Downloaded {networkFile} from {url} failed validation.");
-                        File.Delete(tempNetPath);
-                        continue;
-                    }
+            totalBytes = length;
+            // Mirrors redirect (e.g. to raw.githubusercontent.com); send the segments straight to the final location
+            resolvedUri = response.RequestMessage?.RequestUri ?? new Uri(url);
+            etag = response.Headers.ETag;
+        }
+        catch (HttpRequestException)
+        {
+            return false;
+        }
 
-                    var sizeMb = new FileInfo(tempNetPath).Length / 1024d / 1024d;
-                    File.Move(tempNetPath, destination, true);
-                    progress?.Report($"Saved {networkFile} ({sizeMb:F1} MB).");
-                    downloaded = true;
-                    break;
-                }
-                catch (Exception ex)
-                {
-                    progress?.Report($"Failed to download {networkFile} from {url} ({ex.Message}).");
-                }
+        progress?.Report($"Downloading {totalBytes / 1024d / 1024d:F1} MB in {DownloadSegments} parallel segments...");
+
+        long downloaded = 0;
+        var nextReport = 10;
+        void OnSegmentProgress(int bytesRead)
+        {
+            var percent = (int)(Interlocked.Add(ref downloaded, bytesRead) * 100 / totalBytes);
+            var threshold = Volatile.Read(ref nextReport);
+            if (percent >= threshold && Interlocked.CompareExchange(ref nextReport, (percent / 10 + 1) * 10, threshold) == threshold)
+                progress?.Report($"Downloaded {percent}% ({totalBytes / 1024d / 1024d:F1} MB total)");
+        }
+
+        // One failed segment stops the others, since the whole file is re-fetched over a single connection anyway
+        using var segmentCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        async Task RunSegmentAsync(SafeFileHandle handle, long start, long end)
+        {
+            try
+            {
+                await DownloadSegmentAsync(resolvedUri, handle, start, end, etag, OnSegmentProgress, segmentCts.Token);
             }
+            catch
+            {
+                segmentCts.Cancel();
+                throw;
+            }
+        }
 
-            if (!downloaded)
+        try
+        {
+            using (var handle = File.OpenHandle(destinationPath, FileMode.Create, FileAccess.Write, FileShare.None, FileOptions.Asynchronous, totalBytes))
             {
-                overallSuccess = false;
-                progress?.Report($"Unable to download {networkFile} - make will retry during build.");
+                var segmentSize = (totalBytes + DownloadSegments - 1) / DownloadSegments;
+                var segments = Enumerable.Range(0, DownloadSegments)
+                    .Select(i => (Start: i * segmentSize, End: Math.Min((i + 1) * segmentSize, totalBytes) - 1))
+                    .Where(r => r.Start <= r.End)
+                    .Select(r => RunSegmentAsync(handle, r.Start, r.End));
+                await Task.WhenAll(segments);
             }
+            return true;
+        }
+        catch (Exception ex) when (ex is HttpRequestException or IOException && !cancellationToken.IsCancellationRequested)
+        {
+            progress?.Report($"Segmented download failed ({ex.Message}) - falling back to a single connection.");
+            File.Delete(destinationPath);
+            return false;
         }
+        catch
+        {
+            File.Delete(destinationPath);
+            throw;
+        }
+    }
 
-        return overallSuccess;
+    private async Task DownloadSegmentAsync(Uri uri, SafeFileHandle handle, long start, long end, EntityTagHeaderValue? etag, Action<int> onProgress, CancellationToken cancellationToken)
+    {
+        using var request = new HttpRequestMessage(HttpMethod.Get, uri)
+        {
+            // HTTP/2 would multiplex every segment onto one connection, defeating the point of splitting
+            Version = HttpVersion.Version11,
+            VersionPolicy = HttpVersionPolicy.RequestVersionOrLower
+        };
+        RequestIdentityEncoding(request);
+        request.Headers.Range = new RangeHeaderValue(start, end);
+        if (etag is { IsWeak: false })
+            request.Headers.IfRange = new RangeConditionHeaderValue(etag);
+
+        using var response = await _httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+        response.EnsureSuccessStatusCode();
+        // A 200 here means the server ignored the range or the file changed since the HEAD request
+        if (response.StatusCode != HttpStatusCode.PartialContent || response.Content.Headers.ContentRange?.From != start)
+            throw new IOException($"Server did not honor range {start}-{end}");
+
+        await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+        var buffer = new byte[DownloadBufferSize];
+        var offset = start;
+        int bytesRead;
+        while ((bytesRead = await stream.ReadAsync(buffer, cancellationToken)) != 0)
+        {
+            if (offset + bytesRead > end + 1)
+                throw new IOException($"Server sent more than the requested range {start}-{end}");
+
+            await RandomAccess.WriteAsync(handle, buffer.AsMemory(0, bytesRead), offset, cancellationToken);
+            offset += bytesRead;
+            onProgress(bytesRead);
+        }
+
+        if (offset != end + 1)
+            throw new IOException($"Incomplete segment: received {offset - start} of {end - start + 1} bytes");
+    }
+
+    /// <summary>
+    /// Asks for the file's bytes as stored. The handler decompresses automatically and adds gzip/deflate/br to every
+    /// request unless they are already listed, and byte ranges into a compressed representation don't line up with the file.
+    /// </summary>
+    private static void RequestIdentityEncoding(HttpRequestMessage request)
+    {
+        request.Headers.AcceptEncoding.Add(new StringWithQualityHeaderValue("identity"));
+        foreach (var encoding in new[] { "gzip", "deflate", "br" })
+            request.Headers.AcceptEncoding.Add(new StringWithQualityHeaderValue(encoding, 0));
     }
 
     private async Task SafeDownloadToFileAsync(string url, string destinationPath, IProgress<string>? progress, CancellationToken cancellationToken)
     {
-        using var response = await _httpClient.GetAsync(url, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+        // Never resume a partial file left over from another run; it may belong to a different revision
+        if (File.Exists(destinationPath))
+            File.Delete(destinationPath);
+
+        var etag = new StrongBox<EntityTagHeaderValue?>();
+        for (var attempt = 1; ; attempt++)
+        {
+            try
+            {
+                await DownloadAttemptAsync(url, destinationPath, etag, progress, cancellationToken);
+                return;
+            }
+            catch (Exception ex) when (ex is HttpRequestException or IOException && attempt < MaxDownloadAttempts && !cancellationToken.IsCancellationRequested)
+            {
+                var delay = TimeSpan.FromSeconds(Math.Pow(2, attempt - 1));
+                progress?.Report($"Download interrupted ({ex.Message}) - retrying in {delay.TotalSeconds:F0}s...");
+                await Task.Delay(delay, cancellationToken);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Downloads (or resumes) into destinationPath. The response ETag is kept in <paramref name="etag"/> so a retry can resume with If-Range.
+    /// </summary>
+    private async Task DownloadAttemptAsync(string url, string destinationPath, StrongBox<EntityTagHeaderValue?> etag, IProgress<string>? progress, CancellationToken cancellationToken)
+    {
+        // Only resume against a strong validator, otherwise the server could splice two different files together
+        var existing = File.Exists(destinationPath) ? new FileInfo(destinationPath).Length : 0L;
+        var resume = existing > 0 && etag.Value is { IsWeak: false };
+
+        using var request = new HttpRequestMessage(HttpMethod.Get, url);
+        RequestIdentityEncoding(request);
+        if (resume)
+        {
+            request.Headers.Range = new RangeHeaderValue(existing, null);
+            request.Headers.IfRange = new RangeConditionHeaderValue(etag.Value!);
+        }
+
+        using var response = await _httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
         response.EnsureSuccessStatusCode();
+        etag.Value = response.Headers.ETag;
 
-        var totalBytes = response.Content.Headers.ContentLength ?? -1L;
+        var append = resume && response.StatusCode == HttpStatusCode.PartialContent;
+        if (!append)
+            existing = 0;
+        else
+            progress?.Report($"Resuming download at {existing / 1024d / 1024d:F1} MB...");
+
+        var contentLength = response.Content.Headers.ContentLength;
+        var totalBytes = append
+            ? response.Content.Headers.ContentRange?.Length ?? (contentLength.HasValue ? existing + contentLength.Value : -1L)
+            : contentLength ?? -1L;
         if (totalBytes > MaxDownloadSize)
             throw new InvalidOperationException($"Download too large: {totalBytes} bytes");
 
         using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
-        using var fileStream = new FileStream(destinationPath, FileMode.Create, FileAccess.Write, FileShare.None, 8192, true);
-
-        var buffer = new byte[8192];
-        long totalRead = 0;
+        // Reserve the full size up front on a fresh download so the file isn't fragmented as it grows
+        using var fileStream = new FileStream(destinationPath, new FileStreamOptions
+        {
+            Mode = append ? FileMode.Append : FileMode.Create,
+            Access = FileAccess.Write,
+            Share = FileShare.None,
+            BufferSize = 0,
+            Options = FileOptions.Asynchronous,
+            PreallocationSize = append ? 0 : Math.Max(totalBytes, 0)
+        });
+
+        var buffer = new byte[DownloadBufferSize];
+        long totalRead = existing;
+        var nextReport = totalBytes > 0 ? (int)(existing * 100 / totalBytes / 10 + 1) * 10 : 10;
         int bytesRead;
 
         while ((bytesRead = await stream.ReadAsync(buffer, cancellationToken)) != 0)
@@ -435,40 +747,80 @@ public partial class StockfishDownloader : IStockfishDownloader
 
             if (totalRead > MaxDownloadSize)
                 throw new InvalidOperationException("Download exceeded maximum size");
+
+            if (totalBytes > 0 && totalRead * 100 / totalBytes >= nextReport)
+            {
+                progress?.Report($"Downloaded {totalRead * 100 / totalBytes}% ({totalRead / 1024d / 1024d:F1} of {totalBytes / 1024d / 1024d:F1} MB)");
+                nextReport = (int)(totalRead * 100 / totalBytes / 10 + 1) * 10;
+            }
         }
+
+        if (totalBytes > 0 && totalRead != totalBytes)
+            throw new IOException($"Incomplete download: received {totalRead} of {totalBytes} bytes");
     }
 
     private static void SafeExtractToDirectory(string zipPath, string destinationDirectory)
     {
-        using var archive = ZipFile.OpenRead(zipPath);
         var destDirFullPath = Path.GetFullPath(destinationDirectory);
-        
-        foreach (var entry in archive.Entries)
+        var targets = new List<(int Index, string Path, long Length)>();
+        var directories = new HashSet<string>(StringComparer.Ordinal);
+
+        // Validate every entry before writing anything, then inflate in parallel
+        using (var archive = ZipFile.OpenRead(zipPath))
         {
-            if (string.IsNullOrEmpty(entry.Name)) continue;
+            for (var i = 0; i < archive.Entries.Count; i++)
+            {
+                var entry = archive.Entries[i];
+                if (string.IsNullOrEmpty(entry.Name)) continue;
 
-            var completeFileName = Path.GetFullPath(Path.Combine(destDirFullPath, entry.FullName));
+                var completeFileName = Path.GetFullPath(Path.Combine(destDirFullPath, entry.FullName));
 
-            // More robust check using Path.GetRelativePath
-            try
-            {
-                var relativePath = Path.GetRelativePath(destDirFullPath, completeFileName);
-                if (relativePath.StartsWith("..", StringComparison.Ordinal))
+                // More robust check using Path.GetRelativePath
+                try
                 {
-                    throw new IOException($"Zip Slip vulnerability detected: {entry.FullName}");
+                    var relativePath = Path.GetRelativePath(destDirFullPath, completeFileName);
+                    if (relativePath.StartsWith("..", StringComparison.Ordinal))
+                    {
+                        throw new IOException($"Zip Slip vulnerability detected: {entry.FullName}");
+                    }
+                }
+                catch (ArgumentException)
+                {
+                    throw new IOException($"Invalid path in zip: {entry.FullName}");
                 }
-            }
-            catch (ArgumentException)
-            {
-                throw new IOException($"Invalid path in zip: {entry.FullName}");
-            }
 
-            var directory = Path.GetDirectoryName(completeFileName);
-            if (!string.IsNullOrEmpty(directory))
-                Directory.CreateDirectory(directory);
+                var directory = Path.GetDirectoryName(completeFileName);
+                if (!string.IsNullOrEmpty(directory))
+                    directories.Add(directory);
 
-            entry.ExtractToFile(completeFileName, overwrite: true);
+                targets.Add((i, completeFileName, entry.Length));
+            }
         }
+
+        // A source archive has thousands of files but only a few dozen directories; create each once
+        foreach (var directory in directories)
+            Directory.CreateDirectory(directory);
+
+        // ZipArchive isn't thread-safe, so each worker opens its own handle and takes every Nth entry
+        var workers = targets.Count < MinEntriesForParallelExtract ? 1 : Math.Clamp(Environment.ProcessorCount, 1, 8);
+        Parallel.For(0, workers, worker =>
+        {
+            using var archive = ZipFile.OpenRead(zipPath);
+            for (var i = worker; i < targets.Count; i += workers)
+            {
+                var (index, path, length) = targets[i];
+                // Inflate straight into a presized file; ExtractToFile adds a 4 KiB write buffer and a timestamp update per entry
+                using var source = archive.Entries[index].Open();
+                using var destination = new FileStream(path, new FileStreamOptions
+                {
+                    Mode = FileMode.Create,
+                    Access = FileAccess.Write,
+                    BufferSize = 0,
+                    PreallocationSize = length
+                });
+                source.CopyTo(destination, ExtractBufferSize);
+            }
+        });
     }
 
     private static List<string> DetectNetworkFileNames(string sourceDirectory)
@@ -571,18 +923,14 @@ public partial class StockfishDownloader : IStockfishDownloader
 
         var expectedPrefix = match.Groups[1].Value.ToLowerInvariant();
 
-        using var sha256 = SHA256.Create();
-        await using var stream = File.OpenRead(filePath);
-        var hash = Convert.ToHexString(await sha256.ComputeHashAsync(stream, cancellationToken)).ToLowerInvariant();
+        var hash = await FileSystemHelper.ComputeSha256Async(filePath, cancellationToken);
         return hash.StartsWith(expectedPrefix, StringComparison.Ordinal);
     }
 
     private static async Task<bool> VerifyFileHashAsync(string filePath, string expectedSha256)
     {
         var normalizedExpected = expectedSha256.Replace(" ", string.Empty).ToLowerInvariant();
-        using var sha256 = SHA256.Create();
-        await using var stream = File.OpenRead(filePath);
-        var hash = Convert.ToHexString(await sha256.ComputeHashAsync(stream)).ToLowerInvariant();
+        var hash = await FileSystemHelper.ComputeSha256Async(filePath);
         return hash.Equals(normalizedExpected, StringComparison.OrdinalIgnoreCase);
     }
 }
@@ -1,6 +1,7 @@
 using System.IO;
 using System.Text.Json;
 using Microsoft.Extensions.Logging;
+using StockfishCompiler.Helpers;
 using StockfishCompiler.Models;
 
 namespace StockfishCompiler.Services;
@@ -95,7 +96,7 @@ public class UserSettingsService : IUserSettingsService
 
     private static UserSettings Sanitize(UserSettings settings)
     {
-        settings.ParallelJobs = settings.ParallelJobs <= 0 ? Environment.ProcessorCount : settings.ParallelJobs;
+        settings.ParallelJobs = settings.ParallelJobs <= 0 ? OSHelper.GetPhysicalCoreCount() : settings.ParallelJobs;
         settings.OutputDirectory = string.IsNullOrWhiteSpace(settings.OutputDirectory)
             ? Environment.GetFolderPath(Environment.SpecialFolder.Desktop)
             : settings.OutputDirectory;
@@ -42,11 +42,15 @@ public partial class BuildViewModel : ObservableObject, IDisposable
         _updateTimer.Tick += UpdateTimer_Tick;
         _updateTimer.Start();
 
-        // Marshal all observable subscriptions to UI thread
+        // Progress and build state drive bound properties, so those subscriptions are marshalled to the UI thread
         var uiScheduler = new SynchronizationContextScheduler(SynchronizationContext.Current!);
         
+        // AppendOutput only queues under a lock and the timer pushes batches to the UI, so build output lines
+        // are taken on the producing thread instead of posting one dispatcher callback per make line. make and
+        // strip output comes from BuildService's thread-pool pipe readers; only its own status lines arrive on
+        // the dispatcher. Synchronize serializes the stdout and stderr readers.
         _subscriptions.Add(_buildService.Output
-            .ObserveOn(uiScheduler)
+            .Synchronize(_logLock)
             .Subscribe(
                 onNext: line => AppendOutput(line),
                 onError: ex =>
@@ -164,6 +168,9 @@ public partial class BuildViewModel : ObservableObject, IDisposable
             AppendOutput($"Exit code: {result.ExitCode}");
             AppendOutput("==============================================");
         }
+
+        // Show the result now rather than on the next timer tick
+        FlushOutput();
     }
 
     private async Task CancelBuildAsync()
@@ -189,7 +196,9 @@ public partial class BuildViewModel : ObservableObject, IDisposable
         GC.SuppressFinalize(this);
     }
 
-    private void UpdateTimer_Tick(object? sender, EventArgs e)
+    private void UpdateTimer_Tick(object? sender, EventArgs e) => FlushOutput();
+
+    private void FlushOutput()
     {
         if (Interlocked.Exchange(ref _isDirty, 0) == 1)
         {
@@ -18,9 +18,14 @@ public partial class MainViewModel : ObservableObject, IDisposable
     private readonly IStockfishDownloader _stockfishDownloader;
     private readonly ILogger<MainViewModel> _logger;
     private readonly IUserSettingsService _userSettingsService;
+    private readonly StartupOptions _startupOptions;
     private UserSettings _userSettings = new();
     private bool _isRestoringSettings;
     private bool _isAdjustingParallelJobs;
+    private string? _detectedArchitectureId;
+    private readonly Task _architecturesLoaded;
+    private readonly Task _versionsLoaded;
+    private Task _lastCompilerChecked = Task.CompletedTask;
     private CancellationTokenSource? _saveDebouncer;
     private Task? _pendingSaveTask;
     private bool _disposed;
@@ -30,13 +35,15 @@ public partial class MainViewModel : ObservableObject, IDisposable
         IArchitectureDetector architectureDetector,
         IStockfishDownloader stockfishDownloader,
         ILogger<MainViewModel> logger,
-        IUserSettingsService userSettingsService)
+        IUserSettingsService userSettingsService,
+        StartupOptions startupOptions)
     {
         _compilerService = compilerService;
         _architectureDetector = architectureDetector;
         _stockfishDownloader = stockfishDownloader;
         _logger = logger;
         _userSettingsService = userSettingsService;
+        _startupOptions = startupOptions;
 
         _logger.LogInformation("MainViewModel initializing");
 
@@ -44,8 +51,8 @@ public partial class MainViewModel : ObservableObject, IDisposable
         DetectArchitectureCommand = new AsyncRelayCommand(DetectOptimalArchitectureAsync, () => SelectedCompiler != null);
 
         LoadUserSettings();
-        _ = LoadAvailableArchitectures();
-        _ = LoadAvailableVersionsAsync();
+        _architecturesLoaded = LoadAvailableArchitectures();
+        _versionsLoaded = LoadAvailableVersionsAsync();
         
         _logger.LogInformation("MainViewModel initialized");
     }
@@ -85,7 +92,10 @@ public partial class MainViewModel : ObservableObject, IDisposable
     private bool enablePgo = true;
 
     [ObservableProperty]
-    private int parallelJobs = Environment.ProcessorCount;
+    private bool useCompilerCache = true;
+
+    [ObservableProperty]
+    private int parallelJobs = OSHelper.GetPhysicalCoreCount();
 
     [ObservableProperty]
     private string outputDirectory = Environment.GetFolderPath(Environment.SpecialFolder.Desktop);
@@ -161,6 +171,46 @@ public partial class MainViewModel : ObservableObject, IDisposable
         return msg;
     }
 
+    /// <summary>
+    /// True when the user kept the architecture auto-detected for this machine.
+    /// </summary>
+    public bool IsDetectedArchitectureSelected =>
+        _detectedArchitectureId != null && SelectedArchitecture?.Id == _detectedArchitectureId;
+
+    public BuildConfiguration CreateBuildConfiguration() => new()
+    {
+        SelectedCompiler = SelectedCompiler,
+        SelectedArchitecture = SelectedArchitecture,
+        TargetsNativeCpu = IsDetectedArchitectureSelected,
+        SourceVersion = SourceVersion,
+        DownloadNetwork = DownloadNetwork,
+        StripExecutable = StripExecutable,
+        EnablePgo = EnablePgo,
+        UseCompilerCache = UseCompilerCache,
+        ParallelJobs = ParallelJobs,
+        OutputDirectory = OutputDirectory
+    };
+
+    /// <summary>
+    /// Does what the user would click through for an unattended (--yes) build: detects a compiler and the
+    /// architecture when none is selected. Returns null if either is still missing.
+    /// </summary>
+    public async Task<BuildConfiguration?> PrepareUnattendedBuildAsync()
+    {
+        // Loading the versions list can rewrite SourceVersion, so let it settle before reading the configuration
+        await Task.WhenAll(_architecturesLoaded, _versionsLoaded, _lastCompilerChecked);
+
+        if (SelectedCompiler is not { IsAvailable: true })
+            await DetectCompilersAsync();
+        if (SelectedCompiler == null)
+            return null;
+
+        if (SelectedArchitecture == null)
+            await DetectOptimalArchitectureAsync();
+
+        return SelectedArchitecture == null ? null : CreateBuildConfiguration();
+    }
+
     private async Task DetectOptimalArchitectureAsync()
     {
         if (SelectedCompiler is null)
@@ -177,6 +227,7 @@ public partial class MainViewModel : ObservableObject, IDisposable
             StatusMessage = "Detecting optimal CPU architecture...";
             
             var optimalArch = await _architectureDetector.DetectOptimalArchitectureAsync(SelectedCompiler);
+            _detectedArchitectureId = optimalArch.Id;
             SelectedArchitecture = AvailableArchitectures.FirstOrDefault(a => a.Id == optimalArch.Id) ?? optimalArch;
             StatusMessage = $"Detected: {optimalArch.Name}";
             
@@ -201,6 +252,15 @@ public partial class MainViewModel : ObservableObject, IDisposable
             var list = await _architectureDetector.GetAvailableArchitecturesAsync();
             AvailableArchitectures = new ObservableCollection<ArchitectureInfo>(list);
             _logger.LogInformation("Loaded {Count} architectures", list.Count);
+
+            if (!string.IsNullOrWhiteSpace(_startupOptions.Architecture))
+            {
+                var requested = list.FirstOrDefault(a => string.Equals(a.Id, _startupOptions.Architecture, StringComparison.OrdinalIgnoreCase));
+                if (requested != null)
+                    SelectedArchitecture = requested;
+                else
+                    _logger.LogWarning("Ignoring unknown --arch value: {Architecture}", _startupOptions.Architecture);
+            }
         }
         catch (Exception ex)
         {
@@ -213,6 +273,10 @@ public partial class MainViewModel : ObservableObject, IDisposable
         try
         {
             _logger.LogInformation("Loading available Stockfish versions");
+
+            // Warm the latest-release lookup now so a "stable" build doesn't wait on the GitHub API later
+            _ = _stockfishDownloader.GetLatestReleaseAsync();
+
             var versions = await _stockfishDownloader.GetAvailableVersionsAsync();
             AvailableVersions = new ObservableCollection<StockfishVersionInfo>(versions);
             
@@ -221,6 +285,14 @@ public partial class MainViewModel : ObservableObject, IDisposable
             if (!string.IsNullOrWhiteSpace(SourceVersion))
             {
                 selectedVersion = AvailableVersions.FirstOrDefault(v => v.Id == SourceVersion);
+
+                // Keep a valid tag the releases list doesn't have (older release, or the GitHub API call failed)
+                if (selectedVersion == null && StockfishDownloader.TryCreateVersionInfo(SourceVersion, out var requested))
+                {
+                    _logger.LogInformation("Version {Version} is not in the releases list, keeping it anyway", SourceVersion);
+                    AvailableVersions.Add(requested);
+                    selectedVersion = requested;
+                }
             }
             
             // Fall back to "stable" if saved version not found
@@ -244,6 +316,7 @@ public partial class MainViewModel : ObservableObject, IDisposable
             DownloadNetwork = _userSettings.DownloadNetwork;
             StripExecutable = _userSettings.StripExecutable;
             EnablePgo = _userSettings.EnablePgo;
+            UseCompilerCache = _userSettings.UseCompilerCache;
             ParallelJobs = _userSettings.ParallelJobs;
 
             if (!string.IsNullOrWhiteSpace(_userSettings.OutputDirectory))
@@ -252,6 +325,16 @@ public partial class MainViewModel : ObservableObject, IDisposable
             if (!string.IsNullOrWhiteSpace(_userSettings.SourceVersion))
                 SourceVersion = _userSettings.SourceVersion;
 
+            if (!string.IsNullOrWhiteSpace(_startupOptions.SourceVersion))
+            {
+                if (StockfishDownloader.IsValidSourceVersion(_startupOptions.SourceVersion))
+                    SourceVersion = _startupOptions.SourceVersion;
+                else
+                    _logger.LogWarning("Ignoring invalid --source value: {SourceVersion}", _startupOptions.SourceVersion);
+            }
+
+            RestoreLastCompiler(_userSettings.LastCompiler);
+
             _logger.LogInformation("Loaded user settings from {Path}", _userSettingsService.SettingsFilePath);
         }
         catch (Exception ex)
@@ -264,6 +347,60 @@ public partial class MainViewModel : ObservableObject, IDisposable
         }
     }
 
+    /// <summary>
+    /// Reuses the previously selected compiler if its executable still exists; "Detect Compilers" always rescans.
+    /// </summary>
+    private void RestoreLastCompiler(CompilerInfo? compiler)
+    {
+        if (compiler == null || string.IsNullOrWhiteSpace(compiler.Path) || string.IsNullOrWhiteSpace(compiler.Name))
+            return;
+
+        if (!File.Exists(Path.Combine(compiler.Path, compiler.Name)))
+        {
+            _logger.LogInformation("Previously selected compiler no longer exists: {Path}", compiler.Path);
+            return;
+        }
+
+        // The stored validation result is stale; the background check below fills it in again
+        compiler.ValidationError = null;
+
+        AvailableCompilers = [compiler];
+        SelectedCompiler = compiler;
+        StatusMessage = $"Using last compiler: {compiler.DisplayName} (click Detect to rescan)";
+        _logger.LogInformation("Restored last selected compiler {Compiler}", compiler.DisplayName);
+
+        _lastCompilerChecked = RevalidateLastCompilerAsync(compiler);
+    }
+
+    /// <summary>
+    /// Runs the cheap --version/DLL check on a restored compiler, since the file existing doesn't mean it still runs.
+    /// </summary>
+    private async Task RevalidateLastCompilerAsync(CompilerInfo compiler)
+    {
+        try
+        {
+            // Off the UI thread: starting the compiler process happens before the probe's first await
+            var refreshed = await Task.Run(() => _compilerService.RevalidateCompilerAsync(compiler));
+
+            // Leave things alone if the user rescanned or picked another compiler in the meantime
+            if (!ReferenceEquals(SelectedCompiler, compiler))
+                return;
+
+            AvailableCompilers = [refreshed];
+            SelectedCompiler = refreshed;
+
+            if (!refreshed.IsAvailable)
+            {
+                StatusMessage = $"Last compiler failed validation: {refreshed.ValidationError ?? "it did not run"} (click Detect to rescan)";
+                _logger.LogWarning("Restored compiler {Compiler} failed validation: {Error}", refreshed.DisplayName, refreshed.ValidationError);
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Could not revalidate last compiler {Compiler}", compiler.DisplayName);
+        }
+    }
+
     private void PersistUserSettings()
     {
         if (_isRestoringSettings)
@@ -284,9 +421,11 @@ public partial class MainViewModel : ObservableObject, IDisposable
                     _userSettings.DownloadNetwork = DownloadNetwork;
                     _userSettings.StripExecutable = StripExecutable;
                     _userSettings.EnablePgo = EnablePgo;
+                    _userSettings.UseCompilerCache = UseCompilerCache;
                     _userSettings.ParallelJobs = ParallelJobs;
                     _userSettings.OutputDirectory = OutputDirectory;
                     _userSettings.SourceVersion = SourceVersion;
+                    _userSettings.LastCompiler = SelectedCompiler;
 
                     _userSettingsService.Save(_userSettings);
                 }
@@ -300,6 +439,8 @@ public partial class MainViewModel : ObservableObject, IDisposable
     partial void OnDownloadNetworkChanged(bool value) => PersistUserSettings();
     partial void OnStripExecutableChanged(bool value) => PersistUserSettings();
     partial void OnEnablePgoChanged(bool value) => PersistUserSettings();
+    partial void OnUseCompilerCacheChanged(bool value) => PersistUserSettings();
+    partial void OnSelectedCompilerChanged(CompilerInfo? value) => PersistUserSettings();
     partial void OnParallelJobsChanged(int value)
     {
         if (_isRestoringSettings || _isAdjustingParallelJobs)
@@ -1,7 +1,6 @@
 using System.Windows;
 using System.Windows.Controls;
 using Microsoft.Extensions.DependencyInjection;
-using StockfishCompiler.Models;
 using StockfishCompiler.ViewModels;
 
 namespace StockfishCompiler.Views
@@ -30,17 +29,7 @@ namespace StockfishCompiler.Views
             if (buildVm == null || mainVm == null)
                 return;
 
-            var config = new BuildConfiguration
-            {
-                SelectedCompiler = mainVm.SelectedCompiler,
-                SelectedArchitecture = mainVm.SelectedArchitecture,
-                SourceVersion = mainVm.SourceVersion,
-                DownloadNetwork = mainVm.DownloadNetwork,
-                StripExecutable = mainVm.StripExecutable,
-                EnablePgo = mainVm.EnablePgo,
-                ParallelJobs = mainVm.ParallelJobs,
-                OutputDirectory = mainVm.OutputDirectory
-            };
+            var config = mainVm.CreateBuildConfiguration();
 
             if (buildVm.StartBuildCommand.CanExecute(config))
             {